@@ -1,5 +1,5 @@
-import os
 import time
+import subprocess
 import logging
 import argparse
 from threading import Thread
@@ -205,7 +205,7 @@ For more information, visit: https://github.com/ToolUse/whisperbox
             return
 
         if args.config:
-            os.system(f"open {config._config_path}")
+            subprocess.run(["open", str(config._config_path)])
             return
 
         if args.devices:
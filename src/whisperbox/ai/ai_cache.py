@@ -0,0 +1,118 @@
+import time
+import hashlib
+import sqlite3
+from contextlib import closing
+from typing import Optional
+from ..utils.logger import log
+from ..utils.utils import get_cache_dir
+
+# Least recently used entries beyond this are evicted on write
+MAX_ENTRIES = 500
+TABLES = ("responses", "transcripts")
+
+
+def get_cache_path():
+    """Get the path to the AI cache database."""
+    return get_cache_dir() / "ai_responses.sqlite"
+
+
+def make_key(*parts) -> str:
+    """Build a cache key from everything that affects the cached value."""
+    return hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+def hash_file(path, chunk_size: int = 1 << 20) -> str:
+    """Hash a file's contents in fixed-size chunks so large files are never fully loaded."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _connect() -> sqlite3.Connection:
+    cache_path = get_cache_path()
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_path, timeout=5)
+    for table in TABLES:
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, used_at REAL NOT NULL)"
+        )
+    return conn
+
+
+def _get(table: str, key: str) -> Optional[str]:
+    try:
+        with closing(_connect()) as conn, conn:
+            row = conn.execute(
+                f"SELECT value FROM {table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row:
+                conn.execute(
+                    f"UPDATE {table} SET used_at = ? WHERE key = ?", (time.time(), key)
+                )
+    except sqlite3.Error as e:
+        log.debug("AI cache lookup failed: %s", e)
+        return None
+    return row[0] if row else None
+
+
+def _store(table: str, key: str, value: str) -> None:
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {table} (key, value, used_at) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            conn.execute(
+                f"DELETE FROM {table} WHERE key NOT IN "
+                f"(SELECT key FROM {table} ORDER BY used_at DESC LIMIT ?)",
+                (MAX_ENTRIES,),
+            )
+    except sqlite3.Error as e:
+        log.debug("AI cache write failed: %s", e)
+
+
+def get_response(key: str) -> Optional[str]:
+    """Return the cached LLM response for a key, or None on a miss.
+
+    Args:
+        key: Key built with make_key
+
+    Returns:
+        Optional[str]: The cached response if present
+    """
+    return _get("responses", key)
+
+
+def store_response(key: str, response: str) -> None:
+    """Store an LLM response in the cache. Failures are logged and ignored.
+
+    Args:
+        key: Key built with make_key
+        response: The model's response
+    """
+    _store("responses", key, response)
+
+
+def get_transcript(key: str) -> Optional[str]:
+    """Return the cached Whisper transcript for a key, or None on a miss.
+
+    Args:
+        key: Key built with make_key from the model name and hash_file
+
+    Returns:
+        Optional[str]: The cached transcript if present
+    """
+    return _get("transcripts", key)
+
+
+def store_transcript(key: str, transcript: str) -> None:
+    """Store a Whisper transcript in the cache. Failures are logged and ignored.
+
+    Args:
+        key: Key built with make_key from the model name and hash_file
+        transcript: The timestamped transcript
+    """
+    _store("transcripts", key, transcript)
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 from typing import Optional, Type, TypeVar
 from anthropic import Anthropic
 from groq import Groq
@@ -5,8 +7,9 @@ import ollama
 from openai import OpenAI
 from pydantic import BaseModel
 import json
-from ..core.config import config
-import os
+from ..core.config import config, API_KEY_ENV_VARS
+from ..utils.logger import log
+from . import ai_cache
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -54,48 +57,61 @@ class AIService:
         Raises:
             ValueError: If no API key is found
         """
-        # Try config first
-        config_key = config.get_api_key(provider)
-        if config_key:
-            return config_key
-        
-        # Try environment variables
-        env_var_map = {
-            "groq": "GROQ_API_KEY",
-            "anthropic": "ANTHROPIC_API_KEY",
-            "openai": "OPENAI_API_KEY"
-        }
-        
-        env_var = env_var_map.get(provider)
-        if env_var:
-            env_key = os.getenv(env_var)
-            if env_key:
-                return env_key
-            
+        # Config.get_api_key checks the config file, then the environment
+        api_key = config.get_api_key(provider)
+        if api_key:
+            return api_key
+
         raise ValueError(
             f"No API key found for {provider}. Please set it in the config file "
-            f"or set the {env_var} environment variable."
+            f"or set the {API_KEY_ENV_VARS.get(provider)} environment variable."
         )
 
     def query(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 1024) -> str:
-        """Query AI with optional system prompt"""
+        """Query AI with optional system prompt.
+
+        Responses are cached by exact prompt unless ai.cache_responses is false.
+        """
+        use_cache = config.ai.get("cache_responses", True)
+        if use_cache:
+            cache_key = ai_cache.make_key(
+                self.service_type, self.model, system_prompt, max_tokens, prompt
+            )
+            cached = ai_cache.get_response(cache_key)
+            if cached is not None:
+                return cached
+
         for _ in range(3):  # max_retries
             try:
-                if self.service_type == "ollama":
-                    return self._query_ollama(prompt, system_prompt)
-                elif self.service_type == "groq":
-                    return self._query_groq(prompt, system_prompt, max_tokens)
-                elif self.service_type == "anthropic":
-                    response = self._query_anthropic(prompt, system_prompt, max_tokens)
-                    if hasattr(response, "content") and isinstance(response.content, list):
-                        return response.content[0].text if response.content else ""
-                    return str(response)
-                else:
-                    raise ValueError(f"Unsupported service type: {self.service_type}")
+                response = self._query(prompt, system_prompt, max_tokens)
             except Exception as e:
-                print(f"Error occurred: {e}. Retrying...")
+                log.warning(f"Error occurred: {e}. Retrying...")
+                continue
+            if use_cache:
+                ai_cache.store_response(cache_key, response)
+            return response
         raise Exception(f"Failed to query {self.service_type} after 3 attempts")
 
+    def _query(self, prompt: str, system_prompt: Optional[str], max_tokens: int) -> str:
+        if self.service_type == "ollama":
+            return self._query_ollama(prompt, system_prompt)
+        elif self.service_type == "groq":
+            return self._query_groq(prompt, system_prompt, max_tokens)
+        elif self.service_type == "anthropic":
+            response = self._query_anthropic(prompt, system_prompt, max_tokens)
+            if hasattr(response, "content") and isinstance(response.content, list):
+                return response.content[0].text if response.content else ""
+            return str(response)
+        else:
+            raise ValueError(f"Unsupported service type: {self.service_type}")
+
+    async def aquery(self, prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 1024) -> str:
+        """Async variant of query, so several prompts can be awaited together.
+
+        The provider SDKs are blocking, so the call runs in a worker thread.
+        """
+        return await asyncio.to_thread(self.query, prompt, system_prompt, max_tokens)
+
     def _query_ollama(self, prompt: str, system_prompt: Optional[str] = None) -> str:
         messages = []
         if system_prompt:
@@ -151,10 +167,10 @@ class AIService:
             if message.parsed:
                 return message.parsed
             else:
-                print(message.refusal)
+                log.warning(message.refusal)
                 return message.refusal
         except Exception as e:
-            print(f"Error in OpenAI structured output: {e}")
+            log.error(f"Error in OpenAI structured output: {e}")
             raise
 
     def query_structured(self, prompt: str, data_model: Type[T], system_prompt: Optional[str] = None) -> T:
@@ -166,3 +182,13 @@ class AIService:
             )
             
         return self.openai_structured_output(system_prompt, prompt, data_model)
+
+
+@functools.lru_cache(maxsize=None)
+def get_ai_service(service_type: Optional[str] = None, model: Optional[str] = None) -> AIService:
+    """Get a shared AIService for the given provider and model.
+
+    Reusing one instance keeps the provider client and its connection pool
+    alive across calls instead of rebuilding them for every query.
+    """
+    return AIService(service_type=service_type, model=model)
@@ -1,9 +1,12 @@
+from pathlib import Path
 from rich.console import Console
-from .ai_service import AIService
+from .ai_service import get_ai_service
 from typing import Optional
 from ..utils.logger import log
 console = Console()
 
+TRANSCRIPT_HEADER = "# Meeting Transcription\n\n"
+
 
 def process_transcript(
     transcript_path: str,
@@ -21,14 +24,13 @@ def process_transcript(
         str: The processed result from the AI
     """
     try:
-        with open(transcript_path, "r") as f:
-            transcript_text = f.read()
-            
+        transcript_text = Path(transcript_path).read_text(encoding="utf-8")
+
         log.debug("=== Raw Transcript ===")
         log.debug(transcript_text)
 
         # Remove the markdown header to get clean text
-        clean_text = transcript_text.replace("# Meeting Transcription\n\n", "").strip()
+        clean_text = transcript_text.removeprefix(TRANSCRIPT_HEADER).strip()
         
         log.debug("=== Clean Text ===")
         log.debug(clean_text)
@@ -36,13 +38,14 @@ def process_transcript(
         if not prompt:
             raise ValueError("No prompt provided for processing")
 
+        ai_service = get_ai_service(service_type=ai_provider)
+
         # Format the prompt template with the clean text
         formatted_prompt = prompt.format(transcript=clean_text)
         log.debug("=== Formatted Prompt ===")
         log.debug(formatted_prompt)
         
-        # Process with AI service
-        ai_service = AIService(service_type=ai_provider)
+        # Process with AI service; it caches responses by prompt
         result = ai_service.query(formatted_prompt)
         
         log.debug("=== AI Result ===")
@@ -1,27 +1,38 @@
 #!/usr/bin/env python
-import argparse
 import subprocess
 import os
+import re
+import json
+import ssl
+import atexit
+import socket
+import asyncio
 import time
-import pyaudio
+import platform
+import errno
+import shutil
+import tempfile
+import contextlib
+import threading
+import traceback
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import io
 import wave
-from pydub import AudioSegment
-from rich.console import Console
-from rich.layout import Layout
-from rich.panel import Panel
-from rich.text import Text
-from rich.table import Table
-from rich import box
-import select
-import sys
-from .ai_service import AIService
-from urllib.request import urlretrieve
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    TextColumn,
+    TransferSpeedColumn,
+)
+from .ai_service import get_ai_service
+from . import ai_cache
+from urllib.request import Request, urlopen
 from ..core.config import config, DEFAULT_CONFIG
-from ..audio.audio import AudioRecorder, convert_to_wav
 from ..utils.logger import log
-from ..utils.utils import get_models_dir, get_app_dir
-
-console = Console()
+from ..utils.utils import get_models_dir, get_whisper_model_filename
 
 # Get model name from config, with fallback to tiny.en
 OLLAMA_MODEL = config.ai.default_model
@@ -32,20 +43,180 @@ ASCII_ART = """
 WhisperBox
 """
 
+# Model downloads are split into this many parallel HTTP range requests
+DOWNLOAD_CONNECTIONS = 8
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Resident whisperfile server, enabled with transcription.whisper.server
+WHISPER_SERVER_HOST = "127.0.0.1"
+WHISPER_SERVER_PORT = 8089
+WHISPER_SERVER_START_TIMEOUT = 120
+# Length of the silent clip sent to a new server so the first real request is fast
+WHISPER_SERVER_WARMUP_SECONDS = 1
+
+# Clips in a batch are padded to a multiple of Whisper's 30 s window
+BATCH_WINDOW_MS = 30_000
+# Parallel chunks shorter than this spend more time loading the model than decoding
+PARALLEL_MIN_CHUNK_MS = 5 * 60 * 1000
+# How far from an even split to look for a pause to cut at
+PARALLEL_CUT_WINDOW_MS = 5_000
+# Size of Whisper's input audio: 16 kHz, mono, 16-bit
+WHISPER_WAV_BYTES_PER_MS = 32
+# Temp WAVs only go to /dev/shm while it keeps this much headroom; Docker's
+# default /dev/shm is only 64 MB
+TMPFS_HEADROOM = 2
+TIMESTAMP_RE = re.compile(
+    r"^\[(\d{2}:\d{2}:\d{2}\.\d{3}) --> (\d{2}:\d{2}:\d{2}\.\d{3})\]"
+)
+# Whisper segment timestamps plus the whitespace around them
+STRIP_TIMESTAMP_RE = re.compile(
+    r"^\s*\[\d{2}:\d{2}:\d{2}\.\d{3} --> \d{2}:\d{2}:\d{2}\.\d{3}\]\s*", re.MULTILINE
+)
+SRT_TIMESTAMP_RE = re.compile(
+    r"^(\d{2}:\d{2}:\d{2}),(\d{3}) --> (\d{2}:\d{2}:\d{2}),(\d{3})"
+)
+
+
+def _get_ssl_context():
+    # Special handling for macOS SSL certificates
+    if platform.system() == 'Darwin':
+        import certifi
+        cert_file = certifi.where()
+        ssl_context = ssl.create_default_context(cafile=cert_file)
+        # Point other HTTP clients at the same bundle
+        os.environ['SSL_CERT_FILE'] = cert_file
+        os.environ['REQUESTS_CA_BUNDLE'] = cert_file
+        return ssl_context
+    return ssl.create_default_context()
+
 
-def check_ffmpeg():
+def _copy_response(response, f, progress, task):
+    while True:
+        chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        f.write(chunk)
+        progress.update(task, advance=len(chunk))
+
+
+def _download_range(url, output_path, start, end, ssl_context, progress, task):
+    request = Request(url, headers={"Range": f"bytes={start}-{end}"})
+    with urlopen(request, context=ssl_context) as response:
+        if response.status != 206:
+            raise IOError(f"Server ignored range request for bytes {start}-{end}")
+        # Each worker owns a disjoint byte range, so no locking is needed
+        with open(output_path, "r+b") as f:
+            f.seek(start)
+            _copy_response(response, f, progress, task)
+
+
+def _load_download_state(state_path, total, part_size):
+    """Return the start offsets of ranges finished by an interrupted download."""
     try:
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        log.error("Error: FFmpeg is not installed.")
-        log.warning("Please install FFmpeg using:")
-        log.info("  brew install ffmpeg")
-        return False
+        with open(state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state["total"] == total and state["part_size"] == part_size:
+            return set(state["done"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return set()
+
+
+def _save_download_state(state_path, total, part_size, done):
+    with open(state_path, "w", encoding="utf-8") as f:
+        json.dump({"total": total, "part_size": part_size, "done": sorted(done)}, f)
+
+
+def _parallel_download(url, output_path, ssl_context, num_conns=DOWNLOAD_CONNECTIONS):
+    """Download a file over several HTTP range requests at once.
+
+    Data goes to ``<output_path>.part`` and is renamed into place once
+    complete, so an interrupted download never looks installed. Finished
+    ranges are recorded next to it, and calling this again resumes from
+    them. Falls back to a single stream when the server does not support
+    ranges.
+    """
+    part_path = f"{output_path}.part"
+    state_path = f"{part_path}.json"
+
+    # Probe with a one-byte range: it follows redirects and reports both
+    # range support and the total size in Content-Range
+    with urlopen(Request(url, headers={"Range": "bytes=0-0"}), context=ssl_context) as response:
+        final_url = response.geturl()
+        content_range = response.headers.get("Content-Range", "")
+        total = None
+        if response.status == 206:
+            try:
+                total = int(content_range.rsplit("/", 1)[1])
+            except (IndexError, ValueError):
+                total = None
+
+    with Progress(
+        TextColumn("[bold green]Downloading..."),
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        console=log.console,
+    ) as progress:
+        if not total:
+            log.debug("Server does not support range requests, using a single stream")
+            with urlopen(url, context=ssl_context) as response:
+                length = response.headers.get("Content-Length")
+                task = progress.add_task("download", total=int(length) if length else None)
+                with open(part_path, "wb") as f:
+                    _copy_response(response, f, progress, task)
+            _finish_download(part_path, output_path)
+            return
+
+        part_size = -(-total // num_conns)
+        ranges = [
+            (start, min(start + part_size, total) - 1)
+            for start in range(0, total, part_size)
+        ]
+
+        done = set()
+        if os.path.exists(part_path) and os.path.getsize(part_path) == total:
+            done = _load_download_state(state_path, total, part_size)
+        if done:
+            log.info(f"Resuming download, {len(done)} of {len(ranges)} parts already complete")
+        else:
+            with open(part_path, "wb") as f:
+                f.truncate(total)
+
+        task = progress.add_task(
+            "download",
+            total=total,
+            completed=sum(end - start + 1 for start, end in ranges if start in done),
+        )
+        state_lock = threading.Lock()
+
+        def fetch(start, end):
+            _download_range(final_url, part_path, start, end, ssl_context, progress, task)
+            with state_lock:
+                done.add(start)
+                _save_download_state(state_path, total, part_size, done)
+
+        pending = [(start, end) for start, end in ranges if start not in done]
+        with ThreadPoolExecutor(max_workers=max(1, len(pending))) as executor:
+            futures = [executor.submit(fetch, start, end) for start, end in pending]
+            for future in futures:
+                future.result()
+
+    _finish_download(part_path, output_path)
+    if os.path.exists(state_path):
+        os.remove(state_path)
+
+
+def _finish_download(part_path, output_path):
+    """Move a completed download into place."""
+    # Flush the data before the rename so a crash can't leave an empty "installed" file
+    with open(part_path, "rb") as f:
+        os.fsync(f.fileno())
+    os.replace(part_path, output_path)
 
 
-def install_whisper_model(model_name, whisperfile_path):
-    full_model_name = f"whisper-{model_name}.llamafile"
+def install_whisper_model(model_name, whisperfile_path, quant=None):
+    full_model_name = get_whisper_model_filename(model_name, quant)
     url = f"{WHISPER_BASE_URL}{full_model_name}"
     output_path = os.path.join(whisperfile_path, full_model_name)
 
@@ -55,62 +226,72 @@ def install_whisper_model(model_name, whisperfile_path):
     log.info(f"Downloading {full_model_name}...")
     log.debug(f"Download URL: {url}")
 
-    # Create a progress bar
-    progress = console.status("[bold green]Downloading...", spinner="dots")
-    progress.start()
-
     try:
-        # Special handling for macOS SSL certificates
-        import platform
-        if platform.system() == 'Darwin':
-            import ssl
-            import certifi
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            # Try to find the macOS certificates as well
-            try:
-                import subprocess
-                cert_file = subprocess.check_output(['python3', '-m', 'certifi']).decode('utf-8').strip()
-                os.environ['SSL_CERT_FILE'] = cert_file
-                os.environ['REQUESTS_CA_BUNDLE'] = cert_file
-            except Exception as e:
-                log.debug(f"Could not set macOS certificates: {e}")
-        else:
-            ssl_context = ssl.create_default_context()
-
-        # Use urllib.request with the SSL context
-        from urllib.request import urlopen
-        with urlopen(url, context=ssl_context) as response:
-            # Read the content in chunks and write to file
-            with open(output_path, 'wb') as f:
-                while True:
-                    chunk = response.read(8192)
-                    if not chunk:
-                        break
-                    f.write(chunk)
-        
-        progress.stop()
+        num_conns = (
+            DOWNLOAD_CONNECTIONS
+            if config.transcription.whisper.parallel_download is not False
+            else 1
+        )
+        _parallel_download(url, output_path, _get_ssl_context(), num_conns)
         os.chmod(output_path, 0o755)
         log.success(f"{full_model_name} installed successfully.")
     except Exception as e:
-        progress.stop()
         log.error(f"Error downloading model: {str(e)}")
         raise
 
 
-def get_whisper_model_path(model_name, whisperfile_path, verbose):
-    full_model_name = f"whisper-{model_name}.llamafile"
+def get_whisper_model_path(model_name, whisperfile_path, verbose, interactive=True):
+    args = (
+        model_name,
+        os.fspath(whisperfile_path),
+        config.transcription.whisper.quant,
+        interactive,
+    )
+    model_path = _resolve_whisper_model_path(*args)
+
+    # A cached path goes stale if the file is deleted, or if the quantized
+    # model is installed after falling back to full precision
+    quant = args[2]
+    quant_path = os.path.join(
+        os.path.dirname(model_path), get_whisper_model_filename(model_name, quant)
+    )
+    if not os.path.exists(model_path) or (
+        model_path != quant_path and os.path.exists(quant_path)
+    ):
+        _resolve_whisper_model_path.cache_clear()
+        model_path = _resolve_whisper_model_path(*args)
+    return model_path
+
+
+# Successful lookups are cached; errors (e.g. a declined download) are retried
+@functools.lru_cache(maxsize=32)
+def _resolve_whisper_model_path(model_name, whisperfile_path, quant, interactive=True):
+    full_model_name = get_whisper_model_filename(model_name, quant)
     # Expand user path if necessary
     whisperfile_path = os.path.expanduser(whisperfile_path)
     model_path = os.path.join(whisperfile_path, full_model_name)
 
     log.debug(f"Looking for Whisper model at: {model_path}")
 
+    # Fall back to an installed full-precision file rather than forcing a download
+    if quant and not os.path.exists(model_path):
+        fallback_name = get_whisper_model_filename(model_name)
+        fallback_path = os.path.join(whisperfile_path, fallback_name)
+        if os.path.exists(fallback_path):
+            log.warning(f"Whisper model {full_model_name} not found, using {fallback_name}")
+            full_model_name, model_path, quant = fallback_name, fallback_path, None
+
     if not os.path.exists(model_path):
+        if not interactive:
+            # Nobody to answer a download prompt, e.g. on a background worker
+            raise FileNotFoundError(
+                f"Whisper model {full_model_name} not found. Run setup to download it."
+            )
         log.warning(f"Whisper model {full_model_name} not found.")
         log.warning(f"Would you like to download it from {WHISPER_BASE_URL}?")
 
         if input("Download model? (y/n): ").lower() == "y":
-            install_whisper_model(model_name, whisperfile_path)
+            install_whisper_model(model_name, whisperfile_path, quant)
         else:
             raise FileNotFoundError(
                 f"Whisper model {full_model_name} not found and download was declined."
@@ -126,25 +307,34 @@ def get_whisper_model_path(model_name, whisperfile_path, verbose):
     return model_path
 
 
-def transcribe_audio(model_name, whisperfile_path, audio_file, verbose):
+def transcribe_audio(
+    model_name,
+    whisperfile_path,
+    audio_file,
+    verbose,
+    model_path=None,
+    on_segment=None,
+    show_status=True,
+):
     try:
         if not model_name:
             model_name = config.get_with_retry("transcription", "whisper", "model")
             log.debug(f"Using default model: {model_name}")
             
         if not model_name:
-            from ..core.config import DEFAULT_CONFIG
             default_model = DEFAULT_CONFIG["transcription"]["whisper"]["model"]
             log.warning(f"Could not get model from config after retries, using default: {default_model}")
             model_name = default_model
             
         log.debug(f"Final model name for transcription: {model_name}")
-        model_path = get_whisper_model_path(model_name, whisperfile_path, verbose)
-        gpu_flag = "--gpu auto" if config.transcription.whisper.gpu_enabled else ""
-        command = f"{model_path} -f {audio_file} {gpu_flag}"
+        if model_path is None:
+            model_path = get_whisper_model_path(model_name, whisperfile_path, verbose)
+        command = [model_path, "-f", audio_file]
+        if config.transcription.whisper.gpu_enabled:
+            command += ["--gpu", "auto"]
 
         if verbose:
-            log.debug(f"Attempting to run command: {command}")
+            log.debug(f"Attempting to run command: {' '.join(command)}")
 
         # Check if file exists and is readable
         if not os.path.exists(audio_file):
@@ -154,13 +344,40 @@ def transcribe_audio(model_name, whisperfile_path, audio_file, verbose):
 
         process = subprocess.Popen(
             command,
-            shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            bufsize=1,
+        )
+
+        # Drain stderr in the background so a chatty model can't block on a full pipe
+        stderr_lines = []
+        stderr_thread = threading.Thread(
+            target=lambda: stderr_lines.extend(process.stderr), daemon=True
+        )
+        stderr_thread.start()
+
+        # Read segments as whisper emits them instead of waiting for EOF
+        stdout_lines = []
+        # Rich allows one live display at a time, so parallel runs go without
+        status_display = (
+            log.console.status("[bold green]Transcribing...", spinner="dots")
+            if show_status
+            else contextlib.nullcontext()
         )
+        with status_display as status:
+            for line in process.stdout:
+                stdout_lines.append(line)
+                if match := TIMESTAMP_RE.match(line):
+                    if status:
+                        status.update(f"[bold green]Transcribing... {match.group(2)}")
+                    if on_segment:
+                        on_segment(line.strip())
 
-        stdout, stderr = process.communicate()
+        process.wait()
+        stderr_thread.join()
+        stdout = "".join(stdout_lines)
+        stderr = "".join(stderr_lines)
 
         if process.returncode != 0:
             log.error(f"Command failed with return code {process.returncode}")
@@ -179,38 +396,259 @@ def transcribe_audio(model_name, whisperfile_path, audio_file, verbose):
 
     except Exception as e:
         log.error(f"Error in transcribe_audio: {str(e)}")
-        import traceback
-
         log.error(f"{traceback.format_exc()}")
 
         raise
 
 
-def summarize(text):
-    ai_service = AIService()
+def srt_to_transcript(srt):
+    """Convert SRT subtitles to whisper's ``[start --> end]   text`` format."""
+    lines = []
+    for block in srt.strip().split("\n\n"):
+        rows = block.strip().splitlines()
+        for i, row in enumerate(rows):
+            match = SRT_TIMESTAMP_RE.match(row)
+            if match:
+                text = " ".join(rows[i + 1:]).strip()
+                lines.append(
+                    f"[{match.group(1)}.{match.group(2)} --> "
+                    f"{match.group(3)}.{match.group(4)}]   {text}"
+                )
+                break
+    return "\n".join(lines)
+
+
+class WhisperServer:
+    """A whisperfile process kept running in server mode between transcriptions.
+
+    Loading the model weights dominates the latency of short recordings, so
+    keeping one process warm avoids paying that cost on every call.
+    """
+
+    def __init__(self, model_path, port=WHISPER_SERVER_PORT):
+        self.model_path = model_path
+        self.port = port
+        self.process = None
+        self._atexit_registered = False
+
+    @property
+    def url(self):
+        return f"http://{WHISPER_SERVER_HOST}:{self.port}"
+
+    def is_running(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self, timeout=WHISPER_SERVER_START_TIMEOUT):
+        """Start the server and wait until it accepts connections."""
+        if self.is_running():
+            return
+
+        # Anything already listening would pass the readiness check below and
+        # be sent our audio
+        if self._port_open():
+            raise RuntimeError(f"Port {self.port} is already in use")
+
+        command = [
+            self.model_path, "--server",
+            "--host", WHISPER_SERVER_HOST,
+            "--port", str(self.port),
+        ]
+        if config.transcription.whisper.gpu_enabled:
+            command += ["--gpu", "auto"]
+
+        log.debug(f"Starting whisper server: {' '.join(command)}")
+        self.process = subprocess.Popen(
+            command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        if not self._atexit_registered:
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+        # The server only listens once the model is loaded
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(
+                    f"Whisper server exited with code {self.process.returncode}"
+                )
+            # Only trust the listener while our child is still alive
+            if self._port_open() and self.process.poll() is None:
+                log.debug(f"Whisper server ready at {self.url}")
+                break
+            time.sleep(0.25)
+        else:
+            self.stop()
+            raise TimeoutError(f"Whisper server did not start within {timeout}s")
+
+        self.warmup()
+
+    def _port_open(self):
+        """Check whether something accepts connections on the server port."""
+        try:
+            with socket.create_connection((WHISPER_SERVER_HOST, self.port), timeout=1):
+                return True
+        except OSError:
+            return False
+
+    def warmup(self):
+        """Run a short silent clip through the server to initialize its compute buffers."""
+        # Only the optional resident server talks HTTP; keep requests off the import path
+        import requests
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(b"\0\0" * 16000 * WHISPER_SERVER_WARMUP_SECONDS)
+        try:
+            requests.post(
+                f"{self.url}/inference",
+                files={"file": ("warmup.wav", buffer.getvalue(), "audio/wav")},
+                data={"response_format": "srt"},
+            ).raise_for_status()
+        except requests.RequestException as e:
+            log.debug(f"Whisper server warmup failed: {e}")
+
+    def stop(self):
+        """Terminate the server process if it is running."""
+        if self.is_running():
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+    def transcribe(self, audio_file):
+        """Transcribe an audio file and return the timestamped transcript."""
+        import requests
+
+        with open(audio_file, "rb") as f:
+            response = requests.post(
+                f"{self.url}/inference",
+                files={"file": f},
+                data={"response_format": "srt"},
+            )
+        response.raise_for_status()
+        return srt_to_transcript(response.text) or None
+
+
+def summarize(text, ai_service=None):
+    ai_service = ai_service or get_ai_service()
     prompt = config.ai.prompts.summary.format(text=text)
     return ai_service.query(prompt)
 
 
-def analyze_sentiment(text):
-    ai_service = AIService()
-    prompt = config.ai.prompts.sentiment.format(text=text)
-    sentiment = ai_service.query(prompt).strip().lower()
+def _normalize_sentiment(response):
+    sentiment = response.strip().lower()
     return sentiment if sentiment in ["positive", "neutral", "negative"] else "neutral"
 
 
-def detect_intent(text):
-    ai_service = AIService()
+def analyze_sentiment(text, ai_service=None):
+    ai_service = ai_service or get_ai_service()
+    prompt = config.ai.prompts.sentiment.format(text=text)
+    return _normalize_sentiment(ai_service.query(prompt))
+
+
+def detect_intent(text, ai_service=None):
+    ai_service = ai_service or get_ai_service()
     prompt = config.ai.prompts.intent.format(text=text)
     return ai_service.query(prompt)
 
 
-def detect_topics(text):
-    ai_service = AIService()
+def detect_topics(text, ai_service=None):
+    ai_service = ai_service or get_ai_service()
     prompt = config.ai.prompts.topics.format(text=text)
     return ai_service.query(prompt)
 
 
+async def _analyze_transcript(text, ai_service):
+    prompts = config.ai.prompts
+    summary, sentiment, intent, topics = await asyncio.gather(
+        ai_service.aquery(prompts.summary.format(text=text)),
+        ai_service.aquery(prompts.sentiment.format(text=text)),
+        ai_service.aquery(prompts.intent.format(text=text)),
+        ai_service.aquery(prompts.topics.format(text=text)),
+    )
+    return {
+        "summary": summary,
+        "sentiment": _normalize_sentiment(sentiment),
+        "intent": intent,
+        "topics": topics,
+    }
+
+
+def _analyze_combined(text, ai_service, prompt):
+    """Ask for all four analyses in one query; return None if the reply isn't usable JSON."""
+    response = ai_service.query(prompt.format(text=text))
+    # Models often wrap JSON in prose or code fences, so parse the outermost object
+    start, end = response.find("{"), response.rfind("}")
+    try:
+        data = json.loads(response[start:end + 1]) if start != -1 else None
+    except ValueError:
+        data = None
+    if not isinstance(data, dict) or not all(
+        key in data for key in ("summary", "sentiment", "intent", "topics")
+    ):
+        log.debug(f"Combined analysis reply was not usable JSON: {response}")
+        return None
+
+    def as_text(value):
+        return ", ".join(map(str, value)) if isinstance(value, list) else str(value)
+
+    return {
+        "summary": as_text(data["summary"]),
+        "sentiment": _normalize_sentiment(as_text(data["sentiment"])),
+        "intent": as_text(data["intent"]),
+        "topics": as_text(data["topics"]),
+    }
+
+
+def analyze_transcript(text, ai_service=None):
+    """Run the summary, sentiment, intent and topic analyses.
+
+    With ``ai.prompts.combined`` configured, all four come from a single
+    JSON-returning query, so the model reads the transcript only once. Otherwise,
+    or if that reply can't be parsed, the four prompts run concurrently.
+
+    Args:
+        text (str): The transcript text
+        ai_service (AIService, optional): Service to query, defaults to the shared one
+
+    Returns:
+        dict: The summary, sentiment, intent and topics results
+    """
+    ai_service = ai_service or get_ai_service()
+    if config.ai.prompts.combined:
+        result = _analyze_combined(text, ai_service, config.ai.prompts.combined)
+        if result:
+            return result
+        if not config.ai.prompts.summary:
+            log.warning("Combined analysis failed and no per-analysis prompts are configured")
+            return {}
+        log.debug("Falling back to separate analysis prompts")
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_analyze_transcript(text, ai_service))
+
+    # asyncio.run cannot nest inside a running loop, so fan out on threads instead
+    helpers = {
+        "summary": summarize,
+        "sentiment": analyze_sentiment,
+        "intent": detect_intent,
+        "topics": detect_topics,
+    }
+    with ThreadPoolExecutor(max_workers=len(helpers)) as executor:
+        futures = {
+            key: executor.submit(helper, text, ai_service)
+            for key, helper in helpers.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+
 def export_to_markdown(text, session_dir):
     """Export transcription text to a markdown file in the session directory.
 
@@ -220,13 +658,154 @@ def export_to_markdown(text, session_dir):
     """
     file_path = os.path.join(session_dir, "whisper_transcript.md")
 
-    with open(file_path, "w") as f:
+    with open(file_path, "w", encoding="utf-8") as f:
         f.write("# Raw Whisper Transcription\n\n")
         f.write(text)
 
     log.save(f"Raw transcription saved to {file_path}")
 
 
+def _estimate_wav_size(audio_file):
+    """Estimate the size of audio_file once converted to Whisper's input format."""
+    try:
+        with wave.open(audio_file, "rb") as wav:
+            duration_ms = wav.getnframes() * 1000 // wav.getframerate()
+        return duration_ms * WHISPER_WAV_BYTES_PER_MS
+    except (OSError, wave.Error, EOFError, ZeroDivisionError):
+        # Compressed input; 16 kHz PCM is at most ~8x a 32 kbps stream
+        return os.path.getsize(audio_file) * 8
+
+
+def _write_temp_wav(prefix, size, write):
+    """Create a temporary WAV by calling write(path) and return its path.
+
+    The file goes on tmpfs so it never hits disk, but only when /dev/shm has
+    room for `size` bytes. Otherwise, or if tmpfs fills up while writing, it
+    goes in the regular temp directory.
+    """
+    directory = None
+    try:
+        if shutil.disk_usage("/dev/shm").free > size * TMPFS_HEADROOM:
+            directory = "/dev/shm"
+    except OSError:
+        pass
+
+    while True:
+        fd, path = tempfile.mkstemp(suffix=".wav", prefix=prefix, dir=directory)
+        os.close(fd)
+        try:
+            write(path)
+            return path
+        except (OSError, RuntimeError) as e:
+            os.remove(path)
+            # ffmpeg reports a full disk in its error message, not an errno
+            out_of_space = getattr(e, "errno", None) == errno.ENOSPC or (
+                os.strerror(errno.ENOSPC) in str(e)
+            )
+            if directory is None or not out_of_space:
+                raise
+            log.debug("/dev/shm is full, writing the temporary WAV to disk instead")
+            directory = None
+        except BaseException:
+            os.remove(path)
+            raise
+
+
+def _is_whisper_ready_wav(audio_file):
+    """Check whether a file is already the 16 kHz mono 16-bit WAV whisper reads."""
+    if os.path.splitext(audio_file)[1].lower() != ".wav":
+        return False
+    try:
+        with wave.open(audio_file, "rb") as wav:
+            return (
+                wav.getframerate() == 16000
+                and wav.getnchannels() == 1
+                and wav.getsampwidth() == 2
+            )
+    except (wave.Error, EOFError):
+        # Float or extensible WAVs, which the wave module can't read
+        return False
+
+
+def _parse_timestamp(timestamp):
+    """Convert a Whisper hh:mm:ss.xxx timestamp to seconds."""
+    hours, minutes, seconds = timestamp.split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def _format_timestamp(seconds):
+    """Convert seconds to a Whisper hh:mm:ss.xxx timestamp."""
+    millis = max(0, round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+
+
+def split_batch_transcript(transcript, offsets):
+    """Split a stitched batch transcript back into per-clip transcripts.
+
+    Args:
+        transcript (str): Timestamped Whisper output for the stitched audio
+        offsets (list[float]): Start offset in seconds of each clip, ascending
+
+    Returns:
+        list[str]: One transcript per clip, with timestamps rebased to the clip
+    """
+    parts = [[] for _ in offsets]
+    index = 0
+    for line in transcript.splitlines():
+        match = TIMESTAMP_RE.match(line)
+        if match:
+            start = _parse_timestamp(match.group(1))
+            end = _parse_timestamp(match.group(2))
+            while index + 1 < len(offsets) and start >= offsets[index + 1]:
+                index += 1
+            offset = offsets[index]
+            line = (
+                f"[{_format_timestamp(start - offset)} --> "
+                f"{_format_timestamp(end - offset)}]{line[match.end():]}"
+            )
+        parts[index].append(line)
+    return ["\n".join(lines).strip() for lines in parts]
+
+
+def strip_timestamps(transcript):
+    """Return the transcript text without segment timestamps or blank lines."""
+    # Remove timestamps in one pass, then drop extra whitespace and empty lines
+    clean_text = STRIP_TIMESTAMP_RE.sub("", transcript)
+    return "\n".join(line for line in map(str.strip, clean_text.splitlines()) if line)
+
+
+def offset_transcript(transcript, offset):
+    """Shift every segment timestamp in a transcript by offset seconds."""
+    lines = []
+    for line in transcript.splitlines():
+        match = TIMESTAMP_RE.match(line)
+        if match:
+            start = _parse_timestamp(match.group(1)) + offset
+            end = _parse_timestamp(match.group(2)) + offset
+            line = (
+                f"[{_format_timestamp(start)} --> "
+                f"{_format_timestamp(end)}]{line[match.end():]}"
+            )
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _find_cut(audio, target_ms):
+    """Return the middle of the pause nearest target_ms, or target_ms if there is none."""
+    from pydub.silence import detect_silence
+
+    window_start = max(0, target_ms - PARALLEL_CUT_WINDOW_MS)
+    window = audio[window_start:target_ms + PARALLEL_CUT_WINDOW_MS]
+    silences = detect_silence(window, min_silence_len=300, silence_thresh=audio.dBFS - 16)
+    if not silences:
+        return target_ms
+    middles = [window_start + (start + end) // 2 for start, end in silences]
+    return min(middles, key=lambda middle: abs(middle - target_ms))
+
+
 def get_sentiment_color(sentiment):
     return {"positive": "green3", "neutral": "gold1", "negative": "red1"}.get(
         sentiment, "white"
@@ -235,17 +814,128 @@ def get_sentiment_color(sentiment):
 
 class Shallowgram:
     def __init__(self, whisperfile_path=None):
-        self.whisperfile_path = whisperfile_path or get_models_dir()
-        self.ai_service = AIService()
+        # Resolved once here; every model lookup joins onto this directory
+        self.whisperfile_path = Path(whisperfile_path or get_models_dir()).expanduser().resolve()
+        self._ai_service = None
+        self._server = None
+        self._server_lock = threading.Lock()
 
-    def transcribe(self, audio_file, model=DEFAULT_WHISPER_MODEL, full_analysis=False):
-        log.debug(f"using file {audio_file}")
-        if not os.path.exists(audio_file):
-            raise FileNotFoundError(f"Audio file not found: {audio_file}")
+        # Load the model while the user is still recording
+        if config.transcription.whisper.server and DEFAULT_WHISPER_MODEL:
+            threading.Thread(
+                target=self._prestart_server, args=(DEFAULT_WHISPER_MODEL,), daemon=True
+            ).start()
+
+    @property
+    def ai_service(self):
+        """The AI service used for analysis, created on first use."""
+        if self._ai_service is None:
+            self._ai_service = get_ai_service()
+        return self._ai_service
+
+    def transcribe(
+        self,
+        audio_file,
+        model=DEFAULT_WHISPER_MODEL,
+        full_analysis=False,
+        invalidate_cache=False,
+        on_segment=None,
+        interactive=True,
+    ):
+        result = self.transcribe_batch(
+            [audio_file],
+            model=model,
+            invalidate_cache=invalidate_cache,
+            on_segment=on_segment,
+            interactive=interactive,
+        )[0]
+        # Analysis needs the ai.prompts section, which is opt-in via config.yaml
+        if result and full_analysis and config.ai.prompts:
+            try:
+                # Timestamps carry nothing the prompts need and inflate the token count
+                result.update(
+                    analyze_transcript(strip_timestamps(result["text"]), self.ai_service)
+                )
+            except Exception as e:
+                # The transcript is still worth returning without the analysis
+                log.warning(f"Transcript analysis failed: {e}")
+        return result
+
+    def transcribe_batch(
+        self,
+        audio_files,
+        model=DEFAULT_WHISPER_MODEL,
+        invalidate_cache=False,
+        on_segment=None,
+        interactive=True,
+    ):
+        """Transcribe several audio files with a single Whisper invocation.
+
+        Files whose audio was already transcribed with the same model are served
+        from the transcript cache. The remaining clips are resampled to 16 kHz
+        mono, padded with silence to a multiple of 30 s and stitched into one
+        WAV, so the model is loaded only once. The output is then split back per
+        clip using the segment timestamps.
 
-        # Ensure we have a valid model
+        Args:
+            audio_files (list[str]): Paths to the audio files
+            model (str, optional): Whisper model name
+            invalidate_cache (bool): Re-run Whisper even if a cached transcript exists
+            on_segment (callable, optional): Called with each newly transcribed
+                ``[start --> end]   text`` line. A single file streams lines as
+                Whisper emits them; stitched batches report them once split.
+            interactive (bool): Whether the console is ours to use. When False,
+                no status spinner is shown and a missing model raises
+                FileNotFoundError instead of prompting for a download.
+
+        Returns:
+            list[dict | None]: One ``{"text": ...}`` result per file, or None
+            where Whisper produced no output for that file
+        """
+        for audio_file in audio_files:
+            log.debug("using file %s", audio_file)
+            if not os.path.exists(audio_file):
+                raise FileNotFoundError(f"Audio file not found: {audio_file}")
+
+        model = self._resolve_model(model)
+
+        # Key on the file actually used, which may be a full-precision fallback
+        model_file = os.path.basename(self._model_path(model, interactive))
+        cache_keys = [
+            ai_cache.make_key(model_file, ai_cache.hash_file(audio_file))
+            for audio_file in audio_files
+        ]
+        transcripts = [
+            None if invalidate_cache else ai_cache.get_transcript(key)
+            for key in cache_keys
+        ]
+        pending = [i for i, transcript in enumerate(transcripts) if transcript is None]
+        if len(pending) < len(audio_files):
+            log.debug(f"Using cached transcripts for {len(audio_files) - len(pending)} file(s)")
+
+        if len(pending) == 1:
+            transcripts[pending[0]] = self._transcribe_file(
+                audio_files[pending[0]], model, on_segment, interactive
+            )
+        elif pending:
+            stitched = self._transcribe_stitched(
+                [audio_files[i] for i in pending], model, interactive
+            )
+            for i, transcript in zip(pending, stitched):
+                transcripts[i] = transcript
+                if transcript and on_segment:
+                    for line in transcript.splitlines():
+                        on_segment(line)
+
+        for i in pending:
+            if transcripts[i]:
+                ai_cache.store_transcript(cache_keys[i], transcripts[i])
+
+        return [{"text": transcript} if transcript else None for transcript in transcripts]
+
+    def _resolve_model(self, model):
+        """Return the model to use, falling back to the default and saving it."""
         if not model:
-            from ..core.config import DEFAULT_CONFIG
             default_model = DEFAULT_CONFIG["transcription"]["whisper"]["model"]
             log.warning(f"No model specified, using default: {default_model}")
             model = default_model
@@ -257,31 +947,196 @@ class Shallowgram:
             config._config["transcription"]["whisper"]["model"] = model
             config.save()
             log.debug(f"Updated config with default model: {model}")
+        return model
+
+    def _model_path(self, model, interactive=True):
+        """Return the whisperfile path for a model."""
+        return get_whisper_model_path(model, self.whisperfile_path, True, interactive)
+
+    def _prestart_server(self, model):
+        # Only start from an installed model; downloads need the interactive prompt
+        model_path = str(
+            self.whisperfile_path
+            / get_whisper_model_filename(model, config.transcription.whisper.quant)
+        )
+        if not os.access(model_path, os.X_OK):
+            return
+        try:
+            self._ensure_server(model_path)
+        except Exception as e:
+            log.debug(f"Could not prestart whisper server: {e}")
+
+    def _ensure_server(self, model_path):
+        """Return a running, warmed-up server for model_path, starting it if needed."""
+        with self._server_lock:
+            if self._server is None or self._server.model_path != model_path:
+                if self._server:
+                    self._server.stop()
+                self._server = WhisperServer(
+                    model_path,
+                    port=config.transcription.whisper.server_port or WHISPER_SERVER_PORT,
+                )
+            self._server.start()
+            return self._server
+
+    def _run_whisper(self, model, audio_file, on_segment=None, interactive=True):
+        """Transcribe with the resident server when enabled, else a one-off process."""
+        model_path = self._model_path(model, interactive)
+        if config.transcription.whisper.server:
+            try:
+                transcript = self._ensure_server(model_path).transcribe(audio_file)
+                if transcript and on_segment:
+                    for line in transcript.splitlines():
+                        on_segment(line)
+                return transcript
+            except Exception as e:
+                log.warning(f"Whisper server unavailable, running whisper directly: {e}")
+
+        return transcribe_audio(
+            model,
+            self.whisperfile_path,
+            audio_file,
+            True,
+            model_path=model_path,
+            on_segment=on_segment,
+            show_status=interactive,
+        )
+
+    def _transcribe_stitched(self, audio_files, model, interactive=True):
+        from pydub import AudioSegment
+
+        log.info(f"Stitching {len(audio_files)} recordings for batch transcription...")
+        stitched = AudioSegment.empty()
+        offsets = []
+        for audio_file in audio_files:
+            clip = (
+                AudioSegment.from_file(audio_file)
+                .set_frame_rate(16000)
+                .set_channels(1)
+                .set_sample_width(2)
+            )
+            padded_ms = max(1, -(-len(clip) // BATCH_WINDOW_MS)) * BATCH_WINDOW_MS
+            offsets.append(len(stitched) / 1000)
+            stitched += clip + AudioSegment.silent(
+                duration=padded_ms - len(clip), frame_rate=16000
+            )
+
+        batch_file = _write_temp_wav(
+            "whisperbox_batch_",
+            len(stitched) * WHISPER_WAV_BYTES_PER_MS,
+            lambda path: stitched.export(path, format="wav"),
+        )
+        try:
+            log.info("Running Whisper transcription...")
+            transcript = self._run_whisper(model, batch_file, interactive=interactive)
+        finally:
+            if os.path.exists(batch_file):
+                os.remove(batch_file)
+
+        if not transcript:
+            log.error("Whisper returned empty transcript")
+            return [None] * len(audio_files)
+
+        return split_batch_transcript(transcript, offsets)
+
+    def _transcribe_parallel(self, audio_file, model, jobs, interactive=True):
+        """Cut a long recording at pauses and run one whisper process per chunk.
+
+        Args:
+            audio_file (str): Path to the WAV file
+            model (str): Whisper model name
+            jobs (int): Maximum number of whisper processes to run at once
+            interactive (bool): Whether a missing model may prompt for a download
+
+        Returns:
+            str | None: The stitched transcript, or None if the recording is
+            too short to be worth splitting
+        """
+        from pydub import AudioSegment
+
+        audio = AudioSegment.from_file(audio_file)
+        jobs = min(jobs, len(audio) // PARALLEL_MIN_CHUNK_MS)
+        if jobs < 2:
+            return None
+
+        cuts = [_find_cut(audio, len(audio) * i // jobs) for i in range(1, jobs)]
+        bounds = list(zip([0] + cuts, cuts + [len(audio)]))
+        model_path = self._model_path(model, interactive)
+
+        chunk_files = []
+        try:
+            for start, end in bounds:
+                chunk = audio[start:end]
+                chunk_files.append(_write_temp_wav(
+                    "whisperbox_chunk_",
+                    len(chunk) * WHISPER_WAV_BYTES_PER_MS,
+                    lambda path: chunk.export(path, format="wav"),
+                ))
+
+            log.info(f"Running Whisper on {jobs} chunks in parallel...")
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                transcripts = list(executor.map(
+                    lambda chunk_file: transcribe_audio(
+                        model,
+                        self.whisperfile_path,
+                        chunk_file,
+                        True,
+                        model_path=model_path,
+                        show_status=False,
+                    ),
+                    chunk_files,
+                ))
+        finally:
+            for chunk_file in chunk_files:
+                if os.path.exists(chunk_file):
+                    os.remove(chunk_file)
+
+        return "\n".join(
+            offset_transcript(transcript, start / 1000)
+            for transcript, (start, _) in zip(transcripts, bounds)
+            if transcript
+        )
+
+    def _transcribe_file(self, audio_file, model, on_segment=None, interactive=True):
+        # Convert unless the file is already in whisper's input format
+        wav_file = None
+        if not _is_whisper_ready_wav(audio_file):
+            # The audio module pulls in PortAudio; only load it when converting
+            from ..audio.audio import convert_to_wav
 
-        # Convert to wav if needed
-        file_ext = os.path.splitext(audio_file)[1].lower()
-        if file_ext != ".wav":
             log.info("Converting audio to WAV format...")
-            wav_file = "temp_audio.wav"
-            convert_to_wav(audio_file, wav_file)
+            source_file = audio_file
+            wav_file = _write_temp_wav(
+                "whisperbox_",
+                _estimate_wav_size(source_file),
+                lambda path: convert_to_wav(source_file, path),
+            )
             audio_file = wav_file
 
         try:
-            log.info("Running Whisper transcription...")
-            transcript = transcribe_audio(
-                model, self.whisperfile_path, audio_file, True
-            )  # Set verbose=True
+            transcript = None
+            jobs = config.transcription.whisper.parallel_jobs or 1
+            # The resident server is a single process, so only one-off runs split
+            if jobs > 1 and not config.transcription.whisper.server:
+                transcript = self._transcribe_parallel(audio_file, model, jobs, interactive)
+                if transcript and on_segment:
+                    for line in transcript.splitlines():
+                        on_segment(line)
+
+            if transcript is None:
+                log.info("Running Whisper transcription...")
+                transcript = self._run_whisper(model, audio_file, on_segment, interactive)
 
             if not transcript:
                 log.error("Whisper returned empty transcript")
                 return None
 
-            return {"text": transcript}
+            return transcript
 
         except Exception as e:
             log.error(f"Error in transcription: {str(e)}")
             raise
         finally:
             # Cleanup temporary file
-            if file_ext != ".wav" and os.path.exists("temp_audio.wav"):
-                os.remove("temp_audio.wav")
+            if wav_file and os.path.exists(wav_file):
+                os.remove(wav_file)
@@ -1,16 +1,18 @@
 import os
 import sys
-import time
 import wave
 import yaml
 import pyaudio
 import select
+import shutil
+import tempfile
+import subprocess
 import platform
-import traceback
+import queue
+import audioop
+import collections
 import threading
-from array import array
 import sounddevice as sd
-from pydub import AudioSegment
 from ..utils.logger import log
 from rich.prompt import Prompt
 from rich.console import Console
@@ -30,63 +32,49 @@ def get_platform():
     return "unknown"
 
 
-def get_system_audio_device_index():
-    """Get system audio capture device index based on platform."""
-    platform = get_platform()
-    
-    if platform == "mac":
-        # On macOS, look for BlackHole
-        return _get_blackhole_device_index()
-    elif platform == "linux":
-        # On Linux, look for common loopback devices
-        return _get_linux_loopback_device_index()
-    elif platform == "windows":
-        # On Windows, look for stereo mix or similar
-        return _get_windows_loopback_device_index()
-    return None
+# Name fragments that identify a system audio loopback device, per platform
+LOOPBACK_DEVICE_NAMES = {
+    "mac": ("blackhole",),
+    "linux": ("pulse", "monitor", "loopback"),
+    "windows": ("stereo mix", "wave out", "cable", "virtual"),
+}
 
+# System audio chunks held for the mic callback; older ones are dropped if the
+# mic stream stalls
+SYSTEM_CHUNK_BACKLOG = 64
 
-def _get_blackhole_device_index():
-    """Find BlackHole audio device on macOS."""
-    p = pyaudio.PyAudio()
-    try:
-        for i in range(p.get_device_count()):
-            device_info = p.get_device_info_by_index(i)
-            device_name = str(device_info.get("name", "")).lower()
-            if "blackhole" in device_name:
-                log.debug("Found BlackHole audio device")
-                return i
-        return None
-    finally:
-        p.terminate()
 
+def get_system_audio_device_index(p=None):
+    """Get system audio capture device index based on platform.
 
-def _get_linux_loopback_device_index():
-    """Find system audio loopback device on Linux."""
-    p = pyaudio.PyAudio()
-    try:
-        for i in range(p.get_device_count()):
-            device_info = p.get_device_info_by_index(i)
-            device_name = str(device_info.get("name", "")).lower()
-            if any(name in device_name for name in ["pulse", "monitor", "loopback"]):
-                return i
-        return None
-    finally:
-        p.terminate()
+    On macOS this looks for BlackHole, on Linux for PulseAudio monitors and
+    loopbacks, and on Windows for Stereo Mix or a virtual cable.
 
+    Args:
+        p (pyaudio.PyAudio, optional): Open PyAudio instance to query. A
+            temporary one is created (and PortAudio re-initialised) if omitted.
 
-def _get_windows_loopback_device_index():
-    """Find system audio loopback device on Windows."""
-    p = pyaudio.PyAudio()
+    Returns:
+        int | None: Index of the first matching input device, if any
+    """
+    names = LOOPBACK_DEVICE_NAMES.get(get_platform())
+    if not names:
+        return None
+
+    owns_pyaudio = p is None
+    if owns_pyaudio:
+        p = pyaudio.PyAudio()
     try:
         for i in range(p.get_device_count()):
             device_info = p.get_device_info_by_index(i)
             device_name = str(device_info.get("name", "")).lower()
-            if any(name in device_name for name in ["stereo mix", "wave out", "cable", "virtual"]):
+            if any(name in device_name for name in names):
+                log.debug(f"Found system audio device: {device_info.get('name')}")
                 return i
         return None
     finally:
-        p.terminate()
+        if owns_pyaudio:
+            p.terminate()
 
 
 def print_system_audio_setup_instructions():
@@ -128,6 +116,7 @@ def get_system_audio_devices():
     """Get list of potential system audio capture devices."""
     p = pyaudio.PyAudio()
     system_devices = []
+    names = LOOPBACK_DEVICE_NAMES.get(get_platform(), ())
     
     try:
         for i in range(p.get_device_count()):
@@ -141,17 +130,7 @@ def get_system_audio_devices():
                     continue
                     
                 # Check if device is a potential system audio capture device
-                platform = get_platform()
-                is_system_device = False
-                
-                if platform == "mac" and "blackhole" in device_name:
-                    is_system_device = True
-                elif platform == "linux" and any(name in device_name for name in ["pulse", "monitor", "loopback"]):
-                    is_system_device = True
-                elif platform == "windows" and any(name in device_name for name in ["stereo mix", "wave out", "cable", "virtual"]):
-                    is_system_device = True
-                    
-                if is_system_device:
+                if any(name in device_name for name in names):
                     system_devices.append({
                         'name': device_info.get("name"),
                         'index': i,
@@ -160,7 +139,7 @@ def get_system_audio_devices():
                     })
                     
             except Exception as e:
-                log.debug(f"Error processing device {i}: {e}")
+                log.debug("Error processing device %s: %s", i, e)
                 continue
                 
         return system_devices
@@ -233,7 +212,7 @@ def select_system_audio_device():
         
     except Exception as e:
         log.error(f"Error updating config: {e}")
-        log.debug(traceback.format_exc())
+        log.debug_exception()
         return None
 
 
@@ -241,22 +220,49 @@ class AudioRecorder:
     def __init__(self):
         self.p = pyaudio.PyAudio()
         self.stream = None
-        self.frames = []
+        # Captured audio goes straight to a temporary WAV file instead of
+        # piling up in memory; save() converts it to the final file
+        self._wav = None
+        self._wav_lock = threading.Lock()
+        self._temp_file = None
+        self._bytes_written = 0
+        # The audio callback only queues chunks; a writer thread does the disk I/O
+        self._write_queue = None
+        self._writer_thread = None
+        # System audio chunks, queued by their stream callback in arrival order
+        # and consumed by the mic's; bytes left over from a chunk carry over
+        self._system_chunks = collections.deque(maxlen=SYSTEM_CHUNK_BACKLOG)
+        self._system_pending = b""
+        # Loopback device index, looked up on the first recording
+        self._loopback_index = None
+        self._loopback_checked = False
         self.is_recording = False
         self.is_paused = False
         self._stop_event = threading.Event()
 
     def _get_loopback_device_index(self):
-        """Find the system audio loopback device."""
-        # Use the new platform-specific detection
-        return get_system_audio_device_index()
+        """Find the system audio loopback device.
+
+        The device scan runs once per recorder, on its own PyAudio instance.
+        """
+        if not self._loopback_checked:
+            self._loopback_index = get_system_audio_device_index(self.p)
+            self._loopback_checked = True
+        return self._loopback_index
 
     def _setup_audio_stream(self):
         """Setup audio stream with appropriate input device."""
         try:
             log.debug("Starting audio stream setup...")
+            # Read the audio settings once; each config.audio lookup builds a
+            # new section wrapper
+            audio_config = config.audio
+            self._channels = int(audio_config.channels)
+            self._rate = int(audio_config.sample_rate)
+            self._chunk_size = int(audio_config.chunk_size)
+            capture_system_audio = audio_config.capture_system_audio
             log.debug(
-                f"Current config - Channels: {config.audio.channels}, Rate: {config.audio.sample_rate}"
+                f"Current config - Channels: {self._channels}, Rate: {self._rate}"
             )
 
             # Try to get loopback device first
@@ -269,31 +275,32 @@ class AudioRecorder:
                 log.debug(f"Default input device: {default_input['name']}")
                 log.debug(f"Max input channels: {default_input['maxInputChannels']}")
                 self.mic_channels = min(
-                    int(default_input["maxInputChannels"]), config.audio.channels
+                    int(default_input["maxInputChannels"]), self._channels
                 )
                 log.debug(f"Using {self.mic_channels} channels for microphone")
             except Exception as e:
                 log.error(f"Error getting default input device info: {e}")
                 raise
 
-            # Create microphone stream with non-blocking
+            # Create microphone stream; PortAudio's own I/O thread delivers
+            # each chunk to the callback
             self.mic_stream = self.p.open(
                 format=pyaudio.paInt16,
                 channels=self.mic_channels,
-                rate=config.audio.sample_rate,
+                rate=self._rate,
                 input=True,
-                frames_per_buffer=config.audio.chunk_size,
-                stream_callback=None,
+                frames_per_buffer=self._chunk_size,
+                stream_callback=self._on_mic_audio,
                 start=False,
             )
             log.debug("Microphone stream created successfully")
 
             # Only try system audio setup after mic is working
-            if loopback_index is not None and config.audio.capture_system_audio:
+            if loopback_index is not None and capture_system_audio:
                 try:
                     device_info = self.p.get_device_info_by_index(loopback_index)
                     system_channels = min(
-                        int(device_info["maxInputChannels"]), config.audio.channels
+                        int(device_info["maxInputChannels"]), self._channels
                     )
                     log.debug(f"System audio device: {device_info['name']}")
                     log.debug(f"Using {system_channels} channels for system audio")
@@ -301,11 +308,11 @@ class AudioRecorder:
                     self.system_stream = self.p.open(
                         format=pyaudio.paInt16,
                         channels=system_channels,
-                        rate=config.audio.sample_rate,
+                        rate=self._rate,
                         input=True,
                         input_device_index=loopback_index,
-                        frames_per_buffer=config.audio.chunk_size,
-                        stream_callback=None,
+                        frames_per_buffer=self._chunk_size,
+                        stream_callback=self._on_system_audio,
                         start=False,
                     )
                     log.debug("System audio stream created successfully")
@@ -313,7 +320,7 @@ class AudioRecorder:
                     self.system_stream = None
                     log.warning(f"Failed to initialize system audio capture: {e}")
 
-            if self.system_stream is None and config.audio.capture_system_audio:
+            if self.system_stream is None and capture_system_audio:
                 log.warning(
                     "No loopback device found or failed to initialize. To capture system audio:"
                 )
@@ -323,12 +330,41 @@ class AudioRecorder:
 
         except Exception as e:
             log.error(f"Error setting up audio streams: {e}")
-            log.debug(traceback.format_exc())
+            log.debug_exception()
             raise
 
+    def _open_temp_wav(self):
+        """Open the temporary WAV file that captured audio is written to."""
+        fd, self._temp_file = tempfile.mkstemp(prefix="whisperbox-", suffix=".wav")
+        os.close(fd)
+        self._wav = wave.open(self._temp_file, "wb")
+        self._wav.setnchannels(self.mic_channels)
+        self._wav.setsampwidth(self.p.get_sample_size(pyaudio.paInt16))
+        self._wav.setframerate(self._rate)
+        self._bytes_written = 0
+
+    def _write_frames(self, data):
+        """Append a chunk of captured audio to the temporary WAV file."""
+        with self._wav_lock:
+            if self._wav is not None:
+                # The header is patched once on close, not after every chunk
+                self._wav.writeframesraw(data)
+                self._bytes_written += len(data)
+
+    def _writer_loop(self):
+        """Drain queued chunks into the temporary WAV until the stop sentinel."""
+        while (data := self._write_queue.get()) is not None:
+            self._write_frames(data)
+
     def start(self):
-        """Start recording in a separate thread."""
+        """Start recording; audio arrives through the stream callbacks."""
         self._setup_audio_stream()
+        self._open_temp_wav()
+        self._write_queue = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+        self._system_chunks.clear()
+        self._system_pending = b""
         self.is_recording = True
         self._stop_event.clear()
 
@@ -337,87 +373,74 @@ class AudioRecorder:
         if self.system_stream:
             self.system_stream.start_stream()
 
-        # Start recording thread
-        self.record_thread = threading.Thread(target=self._record)
-        self.record_thread.start()
-
     def _mix_audio(self, mic_data, system_data):
         """Mix microphone and system audio."""
         if not system_data:
             return mic_data
 
-        # Convert bytes to arrays of signed integers
-        mic_audio = array("h", mic_data)
-        system_audio = array("h", system_data)
+        # Both streams must cover the same samples
+        n = min(len(mic_data), len(system_data))
 
         # Adjust system audio volume (increase clarity)
         system_gain = 1.2  # Adjust this value between 1.0-2.0 to find the sweet spot
 
-        # Mix with adjusted system audio gain
-        mixed = array(
-            "h",
-            [
-                max(
-                    min(m + int(s * system_gain), 32767),  # Apply gain to system audio
-                    -32768,
-                )
-                for m, s in zip(mic_audio, system_audio)
-            ],
-        )
-
-        return mixed.tobytes()
-
-    def _record(self):
-        """Record audio in chunks."""
-        log.debug("Starting recording thread")
-        while not self._stop_event.is_set():
-            if not self.is_paused:
+        # audioop scales and adds 16-bit samples in C, saturating at the
+        # int16 limits instead of wrapping
+        scaled = audioop.mul(system_data[:n], 2, system_gain)
+        return audioop.add(mic_data[:n], scaled, 2)
+
+    def _on_system_audio(self, in_data, frame_count, time_info, status):
+        """PortAudio callback for the system stream; queues each chunk."""
+        self._system_chunks.append(in_data)
+        return (None, pyaudio.paContinue)
+
+    def _take_system_audio(self, size):
+        """Take the next `size` bytes of queued system audio.
+
+        Returns None, leaving the queue untouched, when less than `size` bytes
+        have arrived; they are mixed into a later mic chunk instead.
+        """
+        pending = self._system_pending
+        if len(pending) < size:
+            parts = [pending]
+            available = len(pending)
+            while available < size:
                 try:
-                    # Check if streams are still active
-                    if not self.mic_stream or not self.mic_stream.is_active():
-                        log.debug("Microphone stream no longer active")
-                        break
-
-                    # Use a timeout when reading to make the thread more responsive to stop events
-                    try:
-                        mic_data = self.mic_stream.read(
-                            config.audio.chunk_size, exception_on_overflow=False
-                        )
-                    except Exception as e:
-                        log.debug(f"Error reading from mic stream: {e}")
-                        break
-
-                    # Read from system audio if available
-                    system_data = None
-                    if self.system_stream and self.system_stream.is_active():
-                        try:
-                            system_data = self.system_stream.read(
-                                config.audio.chunk_size, exception_on_overflow=False
-                            )
-                        except Exception as e:
-                            log.debug(f"Error reading from system stream: {e}")
-                            system_data = None
-
-                    # Mix the audio if we have both streams
-                    if system_data:
-                        mixed_data = self._mix_audio(mic_data, system_data)
-                        self.frames.append(mixed_data)
-                    else:
-                        self.frames.append(mic_data)
-
-                except Exception as e:
-                    log.warning(f"Warning in recording thread: {str(e)}")
-                    if "Input overflowed" not in str(e):  # Ignore overflow warnings
-                        log.debug(f"Recording thread error: {str(e)}")
-                        break  # Exit on other errors
-
-            # Add a small sleep to make the thread more responsive to stop events
-            if self._stop_event.wait(0.001):  # 1ms wait
-                log.debug("Stop event detected in recording thread")
-                break
+                    chunk = self._system_chunks.popleft()
+                except IndexError:
+                    self._system_pending = b"".join(parts)
+                    return None
+                parts.append(chunk)
+                available += len(chunk)
+            pending = b"".join(parts)
+        self._system_pending = pending[size:]
+        return pending[:size]
+
+    def _on_mic_audio(self, in_data, frame_count, time_info, status):
+        """PortAudio callback for the mic stream; mixes and writes each chunk."""
+        if self._stop_event.is_set():
+            return (None, pyaudio.paComplete)
+        if status & pyaudio.paInputOverflow:
+            log.debug("Microphone input overflowed")
+
+        if self.is_paused:
+            # Drop system audio captured while paused, so it isn't mixed in
+            # after resuming
+            self._system_chunks.clear()
+            self._system_pending = b""
+        else:
+            system_data = self._take_system_audio(len(in_data))
+            try:
+                # Mix the audio if we have both streams
+                if system_data:
+                    self._write_queue.put(self._mix_audio(in_data, system_data))
+                else:
+                    self._write_queue.put(in_data)
+            except Exception as e:
+                log.warning(f"Warning in recording callback: {e}")
+                return (None, pyaudio.paAbort)
 
-        log.debug("Recording thread exiting")
-        log.debug("Recording thread stopped")
+        return (None, pyaudio.paContinue)
 
     def stop(self):
         """Stop recording and save to file."""
@@ -427,14 +450,11 @@ class AudioRecorder:
 
         log.debug("=== Audio Recorder Stop Sequence ===")
         
-        # First set the stop event to prevent any new data from being read
+        # First set the stop event so the callbacks write no further data
         log.debug("Setting stop event...")
         self._stop_event.set()
         
-        # Give a short pause to let the recording thread notice the stop event
-        time.sleep(0.1)
-        
-        # Now stop the streams
+        # Now stop the streams; this waits for any in-flight callback
         log.debug("Stopping audio streams...")
         try:
             if hasattr(self, "mic_stream") and self.mic_stream:
@@ -452,17 +472,12 @@ class AudioRecorder:
         except Exception as e:
             log.warning(f"Error stopping system stream: {e}")
 
-        # Now join the thread with a shorter timeout
-        if hasattr(self, "record_thread"):
-            log.debug("Waiting for recording thread to finish...")
-            try:
-                self.record_thread.join(timeout=1)
-                if self.record_thread.is_alive():
-                    log.warning("Recording thread still alive after timeout")
-                else:
-                    log.debug("Recording thread joined successfully")
-            except Exception as e:
-                log.warning(f"Error joining record thread: {e}")
+        # No callback can queue more audio now; let the writer finish up
+        if self._writer_thread:
+            log.debug("Waiting for audio writer to finish...")
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
 
         # Close the streams
         log.debug("Closing audio streams...")
@@ -490,36 +505,39 @@ class AudioRecorder:
 
     def save(self, output_file):
         """Save recorded audio to file and convert to 16kHz mono WAV."""
-        if not self.frames:
+        with self._wav_lock:
+            wav, self._wav = self._wav, None
+            if wav is not None:
+                wav.close()
+        temp_file = self._temp_file
+        self._temp_file = None
+
+        if not temp_file:
             log.error("No frames to save")
             return
-            
-        log.debug(f"Saving {len(self.frames)} frames to {output_file}")
-        
-        # Create temp file path
-        temp_file = output_file + ".temp.wav"
-        
+        if not self._bytes_written:
+            log.error("No frames to save")
+            os.remove(temp_file)
+            return
+
+        log.debug(f"Saving {self._bytes_written} bytes of audio to {output_file}")
+
         try:
-            # Save initial WAV file
-            with wave.open(temp_file, "wb") as wf:
-                wf.setnchannels(self.mic_channels)
-                wf.setsampwidth(self.p.get_sample_size(pyaudio.paInt16))
-                wf.setframerate(config.audio.sample_rate)
-                wf.writeframes(b"".join(self.frames))
-            
-            # Convert to 16kHz mono WAV using a context manager
-            audio = None
             try:
-                audio = AudioSegment.from_wav(temp_file)
-                audio = audio.set_frame_rate(16000).set_channels(1).set_sample_width(2)
-                audio.export(output_file, format="wav")
-            finally:
-                # Explicitly delete AudioSegment object
-                del audio
-                
-            # Clean up temp file
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+                _convert_to_whisper_wav(temp_file, output_file)
+            except (wave.Error, audioop.error, ValueError) as e:
+                log.debug(f"In-process conversion failed ({e}), falling back to pydub")
+                # Convert to 16kHz mono WAV using a context manager
+                from pydub import AudioSegment
+
+                audio = None
+                try:
+                    audio = AudioSegment.from_wav(temp_file)
+                    audio = audio.set_frame_rate(16000).set_channels(1).set_sample_width(2)
+                    audio.export(output_file, format="wav")
+                finally:
+                    # Explicitly delete AudioSegment object
+                    del audio
                 
             log.debug(f"Successfully converted audio to 16kHz mono WAV: {output_file}")
             
@@ -528,13 +546,12 @@ class AudioRecorder:
             # If conversion fails, try to keep the original file
             if os.path.exists(temp_file):
                 try:
-                    os.rename(temp_file, output_file)
+                    shutil.move(temp_file, output_file)
                     log.warning("Keeping original audio format")
                 except Exception as rename_error:
                     log.error(f"Error saving original audio: {rename_error}")
         finally:
-            # Clean up frames and ensure temp file is removed
-            self.frames = []
+            # Ensure the temp file is removed
             if os.path.exists(temp_file):
                 try:
                     os.remove(temp_file)
@@ -551,35 +568,87 @@ class AudioRecorder:
             pass
 
 
+def _convert_to_whisper_wav(input_file, output_file):
+    """Convert a 16-bit mono or stereo WAV to 16 kHz mono in-process.
+
+    The file is processed in blocks, so memory use doesn't grow with the
+    length of the recording.
+
+    Args:
+        input_file (str): Path to the source WAV file
+        output_file (str): Path to write the 16 kHz mono WAV file
+
+    Raises:
+        ValueError: If the source isn't 16-bit mono or stereo audio
+    """
+    with wave.open(input_file, "rb") as src:
+        channels = src.getnchannels()
+        rate = src.getframerate()
+        if src.getsampwidth() != 2 or channels not in (1, 2):
+            raise ValueError(
+                f"unsupported WAV format: {channels} channels, "
+                f"{src.getsampwidth() * 8}-bit"
+            )
+
+        with wave.open(output_file, "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(16000)
+
+            state = None
+            while data := src.readframes(65536):
+                if channels == 2:
+                    data = audioop.tomono(data, 2, 0.5, 0.5)
+                if rate != 16000:
+                    # The state carries the filter across block boundaries
+                    data, state = audioop.ratecv(data, 2, 1, rate, 16000, state)
+                out.writeframesraw(data)
+
+
 def convert_to_wav(input_file, output_file):
-    """Convert audio file to WAV format."""
-    audio = AudioSegment.from_file(input_file)
-    audio.export(output_file, format="wav")
+    """Convert audio file to 16 kHz mono WAV, the format whisper expects.
+
+    ffmpeg resamples and writes the file in one pass, so the decoded audio
+    never round-trips through Python.
+    """
+    result = subprocess.run(
+        [
+            "ffmpeg", "-nostdin", "-loglevel", "error", "-y",
+            "-i", input_file,
+            "-ar", "16000", "-ac", "1", "-c:a", "pcm_s16le",
+            output_file,
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to convert {input_file}: {result.stderr.strip()}")
 
 
 def get_input_devices():
     """Get list of available input devices."""
     try:
         devices = sd.query_devices()
+        default_input = sd.default.device[0]
         input_devices = []
         
         for i, device in enumerate(devices):
             try:
-                # Convert device info to a dictionary
-                device_info = dict(device)
-                max_inputs = int(device_info['max_input_channels'])
+                # query_devices() entries are already dicts; read them directly
+                max_inputs = int(device['max_input_channels'])
                 
                 if max_inputs > 0:
                     input_devices.append({
-                        'name': str(device_info['name']),
+                        'name': str(device['name']),
                         'index': i,
                         'channels': max_inputs,
-                        'sample_rate': float(device_info['default_samplerate']),
-                        'input_latency': float(device_info['default_low_input_latency']) * 1000,  # Convert to ms
-                        'is_default': i == sd.default.device[0]
+                        'sample_rate': float(device['default_samplerate']),
+                        'input_latency': float(device['default_low_input_latency']) * 1000,  # Convert to ms
+                        'is_default': i == default_input
                     })
             except (KeyError, ValueError, TypeError) as e:
-                log.debug(f"Skipping device {i} due to error: {e}")
+                log.debug("Skipping device %s due to error: %s", i, e)
                 continue
         
         return input_devices
@@ -648,7 +717,7 @@ def select_audio_device():
 
     except Exception as e:
         log.error(f"Error updating config: {e}")
-        log.debug(traceback.format_exc())
+        log.debug_exception()
 
 
 def list_audio_devices():
@@ -1,20 +1,17 @@
 import os
+import queue
+import threading
 from datetime import datetime
-from rich.console import Console
 from .audio import AudioRecorder
-from ..core.config import config
+from ..core.config import config, DEFAULT_CONFIG
 from ..ai.transcribe import Shallowgram
-from ..ai.transcribe import export_to_markdown
+from ..ai.transcribe import export_to_markdown, strip_timestamps
 from ..utils.logger import log
 from ..utils.utils import create_session_dir
-import traceback
-
-console = Console()
 
 class RecordingManager:
     def __init__(self):
         """Initialize the recording manager."""
-        from ..core.config import config
         log.debug("RecordingManager initialized with config:")
         log.debug(str(config._config))
         self.recorder = AudioRecorder()
@@ -23,6 +20,8 @@ class RecordingManager:
         self.is_paused = False
         self.current_recording = None
         self.current_session_dir = None
+        self._jobs = queue.Queue()
+        self._worker = None
 
     def _get_output_filename(self):
         """Generate output filename based on timestamp."""
@@ -68,8 +67,20 @@ class RecordingManager:
         except Exception as e:
             log.error(f"Error starting recording: {e}")
 
-    def stop_recording(self):
-        """Stop the current recording and transcribe it."""
+    def stop_recording(self, on_complete=None, wait=True):
+        """Stop the current recording and transcribe it.
+
+        Args:
+            on_complete (callable, optional): Called with the recording path
+                once its transcript has been saved
+            wait (bool): Transcribe on the calling thread. When False the
+                recording is queued for a background worker and this returns
+                as soon as the audio is saved, so a new recording can start.
+
+        Returns:
+            str | None: Path to the recording, or None if it could not be
+            saved (or, when waiting, transcribed)
+        """
         if not self.is_recording:
             log.error("No recording in progress")
             return
@@ -90,85 +101,125 @@ class RecordingManager:
             self.is_paused = False
             log.save(f"Recording saved to: {self.current_recording}")
 
-            log.debug("=== Starting Transcription Process ===")
-            # Transcribe the recording
-            log.transcribing("Starting transcription...")
+        except Exception as e:
+            log.error(f"Error stopping recording: {e}")
+            log.debug_exception()
+            return
+
+        # The next recording gets its own session directory, so it cannot
+        # overwrite files that are still being transcribed
+        recording, session_dir = self.current_recording, self.current_session_dir
+        self.current_session_dir = None
+
+        if wait:
+            return self._process_recording(recording, session_dir, on_complete)
+
+        self._start_worker()
+        self._jobs.put((recording, session_dir, on_complete, False))
+        log.info("Recording queued for transcription")
+        return recording
+
+    def wait_idle(self):
+        """Block until every queued recording has been processed."""
+        self._jobs.join()
+
+    def _start_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+            self._worker.start()
+
+    def _worker_loop(self):
+        while True:
+            job = self._jobs.get()
             try:
-                # Get model name with robust fallback
-                model_name = config.get_with_retry("transcription", "whisper", "model")
-                if not model_name:
-                    from ..core.config import DEFAULT_CONFIG
-                    default_model = DEFAULT_CONFIG["transcription"]["whisper"]["model"]
-                    log.warning(f"Could not get model from config after retries, using default: {default_model}")
-                    model_name = default_model
-                    # Update config with default model
-                    if "transcription" not in config._config:
-                        config._config["transcription"] = {}
-                    if "whisper" not in config._config["transcription"]:
-                        config._config["transcription"]["whisper"] = {}
-                    config._config["transcription"]["whisper"]["model"] = model_name
-                    config.save()
-                    log.debug(f"Updated config with default model: {model_name}")
-                
-                log.debug(f"Using Whisper model: {model_name}")
-                result = self.transcriber.transcribe(
-                    self.current_recording,
-                    model=model_name,
-                    full_analysis=True
-                )
-
-                if not result:
-                    log.error("Transcription returned no results")
-                    return
-
-                log.debug("Saving results to markdown...")
-
-                # Save processed results to markdown
-                self._save_results_to_markdown(result)
-
-                log.debug("=== Recording Process Complete ===")
-                # Return the path for potential further processing
-                return self.current_recording
+                self._process_recording(*job)
+            finally:
+                self._jobs.task_done()
+
+    def _process_recording(self, recording, session_dir, on_complete=None, interactive=True):
+        """Transcribe a saved recording and write its markdown files.
+
+        The background worker passes interactive=False: the main thread owns
+        stdin and the live console, so a missing model is an error there
+        instead of a download prompt, and no status spinner is shown.
+        """
+        log.debug("=== Starting Transcription Process ===")
+        # Transcribe the recording
+        log.transcribing("Starting transcription...")
+        try:
+            # Get model name with robust fallback
+            model_name = config.get_with_retry("transcription", "whisper", "model")
+            if not model_name:
+                default_model = DEFAULT_CONFIG["transcription"]["whisper"]["model"]
+                log.warning(f"Could not get model from config after retries, using default: {default_model}")
+                model_name = default_model
+                # Update config with default model
+                if "transcription" not in config._config:
+                    config._config["transcription"] = {}
+                if "whisper" not in config._config["transcription"]:
+                    config._config["transcription"]["whisper"] = {}
+                config._config["transcription"]["whisper"]["model"] = model_name
+                config.save()
+                log.debug(f"Updated config with default model: {model_name}")
+            
+            log.debug(f"Using Whisper model: {model_name}")
+            # Only the transcript is saved here; AI processing is the profile's job
+            result = self.transcriber.transcribe(
+                recording, model=model_name, interactive=interactive
+            )
 
-            except Exception as e:
-                log.error(f"Error during transcription: {e}")
-                log.debug(traceback.format_exc())
+            if not result:
+                log.error("Transcription returned no results")
+                return
+
+            log.debug("Saving results to markdown...")
+
+            # Save processed results to markdown
+            self._save_results_to_markdown(result, session_dir)
+
+            log.debug("=== Recording Process Complete ===")
 
         except Exception as e:
-            log.error(f"Error stopping recording: {e}")
-            log.debug(traceback.format_exc())
+            log.error(f"Error during transcription: {e}")
+            log.debug_exception()
+            return
+
+        if on_complete:
+            try:
+                on_complete(recording)
+            except Exception as e:
+                log.error(f"Error processing recording: {e}")
+                log.debug_exception()
+
+        # Return the path for potential further processing
+        return recording
 
-    def _save_results_to_markdown(self, result):
+    def _save_results_to_markdown(self, result, session_dir):
         """Save transcription results to markdown files in the session directory."""
-        if not self.current_session_dir:
+        if not session_dir:
             log.error("No session directory available")
             return
 
         try:
             # Convert to string first to handle Path objects safely
-            session_dir = str(self.current_session_dir)
+            session_dir = str(session_dir)
             
             # Save main transcript with timestamps
             transcript_path = os.path.join(session_dir, "transcript.md")
-            with open(transcript_path, "w") as f:
+            with open(transcript_path, "w", encoding="utf-8") as f:
                 f.write(f"# Transcript\n\n")
                 f.write(result["text"])
             log.save(f"Transcript saved to: {transcript_path}")
             
             # Save clean text version without timestamps
             text_path = os.path.join(session_dir, "transcript_text.md")
-            with open(text_path, "w") as f:
-                # Remove timestamps using a simple regex
-                import re
-                clean_text = re.sub(r'\[\d{2}:\d{2}:\d{2}\.\d{3} --> \d{2}:\d{2}:\d{2}\.\d{3}\]', '', result["text"])
-                # Remove extra whitespace and empty lines
-                clean_text = "\n".join(line.strip() for line in clean_text.split("\n") if line.strip())
-                f.write(clean_text)
+            with open(text_path, "w", encoding="utf-8") as f:
+                f.write(strip_timestamps(result["text"]))
             log.save(f"Clean text saved to: {text_path}")
             
         except Exception as e:
             log.error(f"Error saving markdown files: {e}")
-            log.debug(traceback.format_exc())
+            log.debug_exception()
 
     def toggle_pause(self):
         """Toggle recording pause state."""
@@ -10,7 +10,12 @@ from ..utils.utils import (
 )
 
 DEFAULT_CONFIG = {
-    "ai": {"default_provider": "ollama", "default_model": "llama3.2"},
+    "ai": {
+        "default_provider": "ollama",
+        "default_model": "llama3.2",
+        # Reuse responses for prompts that were already answered
+        "cache_responses": True,
+    },
     "audio": {
         "format": "wav",
         "channels": 2,
@@ -46,6 +51,14 @@ DEFAULT_CONFIG = {
             "models_path": str(get_models_dir()),
             "base_url": "https://huggingface.co/Mozilla/whisperfile/resolve/main/",
             "gpu_enabled": True,
+            # e.g. q5_0 or q8_0 to use quantized weights; None keeps full precision
+            "quant": None,
+            # Whisper processes to run side by side on long recordings
+            "parallel_jobs": 1,
+            # Fetch model downloads over several connections at once
+            "parallel_download": True,
+            "server": False,
+            "server_port": 8089,
         }
     },
     "system": {
@@ -54,6 +67,12 @@ DEFAULT_CONFIG = {
     },
 }
 
+API_KEY_ENV_VARS = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "groq": "GROQ_API_KEY",
+}
+
 
 class Config:
     def __init__(self):
@@ -115,22 +134,21 @@ class Config:
         save_config(safe_config)
 
     def get_api_key(self, service: str) -> Optional[str]:
-        """Get API key for the specified service from environment variables.
+        """Get API key for the specified service from the config or environment.
 
         Args:
             service (str): Service name (openai, anthropic, groq)
 
         Returns:
-            Optional[str]: API key if found in environment variables, None otherwise
+            Optional[str]: API key if found, None otherwise
         """
-        env_var_map = {
-            "openai": "OPENAI_API_KEY",
-            "anthropic": "ANTHROPIC_API_KEY",
-            "groq": "GROQ_API_KEY",
-        }
-        
-        if env_var := env_var_map.get(service):
-            return os.getenv(env_var)
+        # Plain dict access, no ConfigSection wrappers on this path
+        api_key = self._config.get("api", {}).get(service, {}).get("api_key")
+        if api_key:
+            return api_key
+
+        if env_var := API_KEY_ENV_VARS.get(service):
+            return os.environ.get(env_var)
         return None
 
     @property
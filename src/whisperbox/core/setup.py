@@ -3,13 +3,14 @@ import yaml
 import subprocess
 from rich.prompt import Prompt, Confirm
 from .config import Config, DEFAULT_CONFIG
-from ..ai.transcribe import install_whisper_model, check_ffmpeg
+from ..ai.transcribe import install_whisper_model
 from ..utils.utils import (
     create_app_directory_structure,
     save_config,
     get_config_path,
     get_models_dir,
     get_app_dir,
+    get_whisper_model_filename,
     reveal_in_file_manager,
 )
 from typing import Dict, Any, Union
@@ -298,7 +299,8 @@ def download_model(config: Dict[str, Any]) -> None:
     """Download the selected Whisper model."""
     model_name = config["transcription"]["whisper"]["model"]
     models_path = Path(config["transcription"]["whisper"]["models_path"])
-    model_file = models_path / f"whisper-{model_name}.llamafile"
+    quant = config["transcription"]["whisper"].get("quant")
+    model_file = models_path / get_whisper_model_filename(model_name, quant)
 
     log.info(f"Checking for Whisper model: {model_name}")
 
@@ -312,7 +314,7 @@ def download_model(config: Dict[str, Any]) -> None:
     max_retries = 3
     for attempt in range(max_retries):
         try:
-            install_whisper_model(model_name, str(models_path))
+            install_whisper_model(model_name, str(models_path), quant)
             log.success("Model downloaded successfully!")
             return
         except Exception as e:
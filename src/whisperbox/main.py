@@ -1,5 +1,4 @@
 import os
-import time
 import logging
 import argparse
 from threading import Thread
@@ -16,7 +15,7 @@ from .utils.utils import (
 )
 from .utils.model_utils import check_whisper_model
 from .ai.process_transcript import process_transcript
-from .ai.ai_service import AIService
+from .ai.ai_service import get_ai_service
 from .utils.profile_parser import load_profile_yaml, get_available_profiles
 from .utils.profile_executor import run_profile_actions
 import traceback
@@ -47,7 +46,7 @@ def select_profile():
                     choices.append(choice_str)
                     profile_dict[profile] = profile_data
             except Exception as e:
-                log.debug(f"Error loading profile {profile}: {e}")
+                log.debug("Error loading profile %s: %s", profile, e)
                 continue
 
         if not choices:
@@ -135,11 +134,28 @@ def cli_mode(ai_provider=None, debug=False, profile=None):
         # Initialize AI service if provider specified
         if ai_provider:
             try:
-                ai_service = AIService(service_type=ai_provider)
+                ai_service = get_ai_service(service_type=ai_provider)
             except ValueError as e:
                 logger.error(f"Error initializing AI service: {e}")
                 return
 
+        def on_transcribed(audio_file_path):
+            """Run the profile on a finished transcript (called from the worker)."""
+            transcript_path = get_transcript_path(audio_file_path)
+
+            if transcript_path and profile:
+                logger.info(f"Processing transcript with profile: {profile}...")
+                # run AI
+                processed_output = process_transcript(
+                    transcript_path,
+                    ai_provider=ai_provider,
+                    prompt=profile_data.get("prompt", ""),
+                )
+                # run the actions
+                run_profile_actions(profile_data, processed_output)
+
+            log.done("All done! 🫡")
+
         try:
             while True:
                 try:
@@ -150,22 +166,11 @@ def cli_mode(ai_provider=None, debug=False, profile=None):
                     else:
                         input("Recording in progress. Press Enter to stop...")
                         log.recording("Stopping recording...")
-                        audio_file_path = recording_manager.stop_recording()
-                        transcript_path = get_transcript_path(audio_file_path)
-
-                        if transcript_path and profile:
-                            logger.info(f"Processing transcript with profile: {profile}...")
-                            # run AI
-                            processed_output = process_transcript(
-                                transcript_path,
-                                ai_provider=ai_provider,
-                                prompt=profile_data.get("prompt", ""),
-                            )
-                            # run the actions
-                            run_profile_actions(profile_data, processed_output)
-                            
-                        time.sleep(1)
-                        log.done("All done! Ready for the next recording 🫡")
+                        # Transcription and profile processing run in the
+                        # background, so the next recording can start right away
+                        recording_manager.stop_recording(
+                            on_complete=on_transcribed, wait=False
+                        )
 
                 except EOFError:
                     break
@@ -178,6 +183,8 @@ def cli_mode(ai_provider=None, debug=False, profile=None):
         log.info("\nShutting down...")
         if recording_manager.is_recording:
             recording_manager.stop_recording()
+        log.info("Waiting for pending transcriptions...")
+        recording_manager.wait_idle()
         log.success("Goodbye!")
 
     except Exception as e:
@@ -30,7 +30,7 @@ def run_action(artifact, action_config):
     file_path = os.path.join(session_dir, filename)
 
     # Write content to markdown file
-    with open(file_path, "w") as f:
+    with open(file_path, "w", encoding="utf-8") as f:
         f.write(artifact)
 
     print(f"Content written to {file_path}")
@@ -1,9 +1,10 @@
-from rich.console import Console
+from rich.console import Console, Group
 from rich.theme import Theme
 from rich.style import Style
-from datetime import datetime
+import time
 from typing import Optional
 import sys
+import traceback
 from rich.table import Table
 from ..core.config import config
 
@@ -22,9 +23,37 @@ THEME = Theme({
     'header': 'bold magenta'  # Added header style
 })
 
+# Console markup per level, matching _format_message(prefix + message, level)
+_TEMPLATES = {
+    "info": "[info]%s[/info]\n",
+    "warning": "[warning]⚠️  %s\n[/warning]\n",
+    "error": "[error]❌ %s[/error]\n",
+    "success": "[success]✅ %s[/success]\n",
+    "done": "[done]🎉 %s[/done]\n",
+    "debug": "[debug]🔍 %s[/debug]\n",
+    "recording": "[recording]🎤 %s[/recording]\n",
+    "transcribing": "[transcribing]📝 %s[/transcribing]\n",
+    "save": "[save]💾 %s[/save]\n",
+}
+
+# Timestamps only change once a second; reuse the formatted one until then
+_last_timestamp = (0, "")
+
+
+def _timestamp() -> str:
+    """Return the current wall-clock time as HH:MM:SS."""
+    global _last_timestamp
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        _last_timestamp = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _last_timestamp[1]
+
+
 class Logger:
     def __init__(self):
-        self.console = Console(theme=THEME)
+        # Messages carry explicit markup; skip the highlighter's regex passes,
+        # which are costly on transcript-sized debug output
+        self.console = Console(theme=THEME, highlight=False)
         self.debug_mode = False
         self.ui_callback = None
         
@@ -33,64 +62,75 @@ class Logger:
         self.ui_callback = callback
         
     def _format_message(self, message: str, style: Optional[str] = None) -> str:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted = f"[timestamp]{timestamp}[/timestamp] {message}"
+        # Styled messages carry no timestamp, so only unstyled ones need one
         if style:
-            formatted = f"[{style}]{message}[/{style}]\n"
-        return formatted
+            return f"[{style}]{message}[/{style}]\n"
+        timestamp = _timestamp()
+        return f"[timestamp]{timestamp}[/timestamp] {message}"
         
-    def _log_to_ui(self, message: str):
+    def _log_to_ui(self, message: str, prefix: str = ""):
         """Send log message to UI if callback is set."""
         if self.ui_callback:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            ui_message = f"{timestamp} {message}\n"
+            timestamp = _timestamp()
+            ui_message = f"{timestamp} {prefix}{message}\n"
             self.ui_callback(ui_message)
         
     def info(self, message: str):
         """Log an informational message"""
-        self.console.print(self._format_message(message, "info"))
-        self._log_to_ui(f"ℹ️ {message}")
+        self.console.print(_TEMPLATES["info"] % (message,))
+        self._log_to_ui(message, "ℹ️ ")
         
     def warning(self, message: str):
         """Log a warning message"""
-        self.console.print(self._format_message(f"⚠️  {message}\n", "warning"))
-        self._log_to_ui(f"⚠️ {message}")
+        self.console.print(_TEMPLATES["warning"] % (message,))
+        self._log_to_ui(message, "⚠️ ")
         
     def error(self, message: str):
         """Log an error message"""
-        self.console.print(self._format_message(f"❌ {message}", "error"))
-        self._log_to_ui(f"❌ {message}")
+        self.console.print(_TEMPLATES["error"] % (message,))
+        self._log_to_ui(message, "❌ ")
         
     def success(self, message: str):
         """Log a success message"""
-        self.console.print(self._format_message(f"✅ {message}", "success"))
-        self._log_to_ui(f"✅ {message}")
+        self.console.print(_TEMPLATES["success"] % (message,))
+        self._log_to_ui(message, "✅ ")
         
     def done(self, message: str):
         """Log a done message"""
-        self.console.print(self._format_message(f"🎉 {message}", "done"))
-        self._log_to_ui(f"🎉 {message}")
+        self.console.print(_TEMPLATES["done"] % (message,))
+        self._log_to_ui(message, "🎉 ")
         
-    def debug(self, message: str):
-        """Log a debug message (only in debug mode)"""
+    def debug(self, message: str, *args):
+        """Log a debug message (only in debug mode)
+
+        Extra args are %-formatted into the message only when debug mode is on,
+        so callers on hot paths don't pay for formatting that is thrown away.
+        """
         if self.debug_mode:
-            self.console.print(self._format_message(f"🔍 {message}", "debug"))
-            self._log_to_ui(f"🔍 {message}")
+            if args:
+                message = message % args
+            self.console.print(_TEMPLATES["debug"] % (message,))
+            self._log_to_ui(message, "🔍 ")
             
+    def debug_exception(self):
+        """Log the traceback of the exception being handled (only in debug mode)"""
+        if self.debug_mode:
+            self.debug(traceback.format_exc())
+
     def recording(self, message: str):
         """Log a recording-related message"""
-        self.console.print(self._format_message(f"🎤 {message}", "recording"))
-        self._log_to_ui(f"🎤 {message}")
+        self.console.print(_TEMPLATES["recording"] % (message,))
+        self._log_to_ui(message, "🎤 ")
         
     def transcribing(self, message: str):
         """Log a transcription-related message"""
-        self.console.print(self._format_message(f"📝 {message}", "transcribing"))
-        self._log_to_ui(f"📝 {message}")
+        self.console.print(_TEMPLATES["transcribing"] % (message,))
+        self._log_to_ui(message, "📝 ")
         
     def save(self, message: str):
         """Log a save-related message"""
-        self.console.print(self._format_message(f"💾 {message}", "save"))
-        self._log_to_ui(f"💾 {message}")
+        self.console.print(_TEMPLATES["save"] % (message,))
+        self._log_to_ui(message, "💾 ")
         
     def status(self, message: str):
         """Update the current status"""
@@ -116,13 +156,14 @@ class Logger:
     def print_instructions(self):
         """Print usage instructions."""
 
-        # Print commands
-        self.console.print("\n[cyan]Commands:[/cyan]")
+        # Print commands, collected into one console write
+        lines = ["\n[cyan]Commands:[/cyan]"]
         for cmd, details in config.commands.items():
             if isinstance(details, dict) and 'description' in details:
-                self.console.print(f"  [cyan]{cmd:<8}[/cyan] {details['description']}")
-        
-        self.console.print()
+                lines.append(f"  [cyan]{cmd:<8}[/cyan] {details['description']}")
+        lines.append("")
+
+        self.console.print("\n".join(lines))
 
     def show_recording_status(self, is_recording: bool, is_paused: bool):
         """Show the current recording status."""
@@ -147,7 +188,6 @@ class Logger:
         self.print_header()
         
         # Commands section with table
-        self.console.print("\n[bold cyan]Available Commands:[/bold cyan]")
         cmd_table = Table(show_header=False, padding=(0, 2))
         cmd_table.add_column(style="cyan", justify="left")
         cmd_table.add_column(style="white", justify="left")
@@ -155,21 +195,22 @@ class Logger:
         for cmd, details in config.commands.items():
             if isinstance(details, dict) and 'description' in details:
                 cmd_table.add_row(cmd, details['description'])
-        self.console.print(cmd_table)
-        
-        # Features and tips remain the same
-        self.console.print("\n[bold cyan]Recording Features:[/bold cyan]")
-        self.console.print("  • Records from both microphone and system audio (if available)")
-        self.console.print("  • Automatically transcribes after recording stops")
-        self.console.print("  • Provides AI-powered summary and analysis")
-        self.console.print("  • Saves recordings to the 'recordings' directory")
-        
-        self.console.print("\n[bold cyan]Tips:[/bold cyan]")
-        self.console.print("  • Install BlackHole for system audio capture")
-        self.console.print("  • Use 'devices' command to check audio inputs")
-        self.console.print("  • Configure Whisper model in config for better accuracy")
-        
-        self.console.print("\nPress Enter to return to main screen...")
+
+        # Render everything in a single print so the terminal gets one write
+        self.console.print(Group(
+            "\n[bold cyan]Available Commands:[/bold cyan]",
+            cmd_table,
+            "\n[bold cyan]Recording Features:[/bold cyan]",
+            "  • Records from both microphone and system audio (if available)",
+            "  • Automatically transcribes after recording stops",
+            "  • Provides AI-powered summary and analysis",
+            "  • Saves recordings to the 'recordings' directory",
+            "\n[bold cyan]Tips:[/bold cyan]",
+            "  • Install BlackHole for system audio capture",
+            "  • Use 'devices' command to check audio inputs",
+            "  • Configure Whisper model in config for better accuracy",
+            "\nPress Enter to return to main screen...",
+        ))
 
 # Global logger instance
 log = Logger() 
\ No newline at end of file
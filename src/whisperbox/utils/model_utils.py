@@ -1,6 +1,7 @@
 from pathlib import Path
 from ..core.config import config
 from ..utils.logger import log
+from ..utils.utils import get_whisper_model_filename
 from ..core.setup import download_model
 
 
@@ -8,7 +9,9 @@ def check_whisper_model():
     """Check if Whisper model exists and download if missing."""
     model_name = config.transcription.whisper.model
     models_path = Path(config.transcription.whisper.models_path)
-    model_file = models_path / f"whisper-{model_name}.llamafile"
+    model_file = models_path / get_whisper_model_filename(
+        model_name, config.transcription.whisper.quant
+    )
 
     if not model_file.exists():
         log.warning(f"Whisper model {model_name} not found at: {model_file}")
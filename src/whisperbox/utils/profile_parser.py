@@ -1,13 +1,29 @@
 # src/utils/profile_parser.py
 
 import os
+import copy
 import yaml
+from collections import OrderedDict
 from yaml.scanner import ScannerError
 from yaml.parser import ParserError
 from ..core.config import config
 from ..utils.logger import log
 from ..utils.utils import get_profiles_dir
 
+# libyaml's C loader parses much faster; PyYAML builds without it fall back
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Validated profiles as path -> (mtime_ns, size, data), least recently used first
+_profile_cache = OrderedDict()
+PROFILE_CACHE_SIZE = 100
+
+# (profiles_dir, mtime_ns) of the last directory scan and the names it found
+_profiles_list_key = None
+_profiles_list = []
+
 
 def load_profile_yaml(profile_name: str):
     """
@@ -16,14 +32,33 @@ def load_profile_yaml(profile_name: str):
     Shows user-friendly error messages for YAML parsing issues.
     """
     profiles_dir = get_profiles_dir()
-    profile_path = os.path.join(profiles_dir, f"{profile_name}.yaml")
-    
-    if not os.path.isfile(profile_path):
-        raise FileNotFoundError(f"Profile file not found: {profile_path}")
+    profile_path = f"{profiles_dir}{os.sep}{profile_name}.yaml"
+
+    try:
+        stat = os.stat(profile_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Profile file not found: {profile_path}") from None
+
+    entry = _profile_cache.get(profile_path)
+    if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        _profile_cache.move_to_end(profile_path)
+        data = entry[2]
+    else:
+        data = _parse_profile(profile_name, profile_path)
+        _profile_cache[profile_path] = (stat.st_mtime_ns, stat.st_size, data)
+        _profile_cache.move_to_end(profile_path)
+        if len(_profile_cache) > PROFILE_CACHE_SIZE:
+            _profile_cache.popitem(last=False)
+
+    # Callers and action scripts may modify the profile; keep the cached copy intact
+    return copy.deepcopy(data)
 
+
+def _parse_profile(profile_name: str, profile_path: str):
+    """Parse and validate a profile file."""
     try:
         with open(profile_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
 
     except (ScannerError, ParserError) as e:
         # Get the problematic line number and content if available
@@ -50,19 +85,17 @@ def load_profile_yaml(profile_name: str):
         log.error("It should start with fields like 'name:', 'prompt:', etc.")
         raise ValueError("Profile YAML must be a dictionary")
 
-    required_fields = ["prompt"]
-    missing_fields = [field for field in required_fields if field not in data]
-    if missing_fields:
+    # 'prompt' is the only required field
+    if "prompt" not in data:
         log.error(f"\nProfile {profile_name}.yaml is missing required fields:")
-        for field in missing_fields:
-            log.error(f"- {field}")
-        raise ValueError(f"Required fields missing in profile: {', '.join(missing_fields)}")
+        log.error("- prompt")
+        raise ValueError("Required fields missing in profile: prompt")
 
     # Optional defaults / validation
     data.setdefault("name", profile_name)
-    data.setdefault("actions", [])
+    actions = data.setdefault("actions", [])
 
-    if not isinstance(data["actions"], list):
+    if not isinstance(actions, list):
         log.error(f"\nIn profile {profile_name}.yaml:")
         log.error("The 'actions' field must be a list of action items")
         log.error("Example format:")
@@ -72,7 +105,7 @@ def load_profile_yaml(profile_name: str):
         log.error("      key: value")
         raise ValueError("'actions' must be a list")
 
-    for action in data["actions"]:
+    for action in actions:
         if not isinstance(action, dict):
             log.error(f"\nIn profile {profile_name}.yaml:")
             log.error("Each action must be a dictionary with 'script' and optional 'config'")
@@ -88,13 +121,36 @@ def load_profile_yaml(profile_name: str):
 
 
 def get_available_profiles():
-    """Return a list of available profile names."""
+    """Return a list of available profile names.
+
+    The directory is only rescanned when its mtime changes, which happens
+    whenever a profile is added, removed or renamed.
+    """
+    global _profiles_list_key, _profiles_list
+
     profiles_dir = get_profiles_dir()
-    if not profiles_dir or not os.path.exists(profiles_dir):
+    if not profiles_dir:
         return []
+    try:
+        key = (str(profiles_dir), os.stat(profiles_dir).st_mtime_ns)
+    except FileNotFoundError:
+        return []
+
+    if key != _profiles_list_key:
+        profiles = []
+        with os.scandir(profiles_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".yaml"):
+                    name = name[:-5]
+                elif name.endswith(".yml"):
+                    name = name[:-4]
+                else:
+                    continue
+                if entry.is_file():
+                    profiles.append(name)
+        # Directory order is arbitrary; list profiles alphabetically
+        profiles.sort(key=str.lower)
+        _profiles_list_key, _profiles_list = key, profiles
 
-    profiles = []
-    for file in os.listdir(profiles_dir):
-        if file.endswith(".yaml") or file.endswith(".yml"):
-            profiles.append(os.path.splitext(file)[0])
-    return profiles
+    return list(_profiles_list)
@@ -1,41 +1,79 @@
 import os
+import functools
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Union
 import platform
+import shutil
 import subprocess
 from datetime import datetime
 
 # Application name - this will be used for the app directory
 APP_NAME = "WhisperBox"
 
+# libyaml's C loader/dumper are much faster; PyYAML builds without it fall back
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
+
+@functools.lru_cache(maxsize=1)
 def get_app_dir() -> Path:
-    """Get the application directory in the user's Documents folder."""
+    """Get the application directory in the user's Documents folder.
+
+    This and the path helpers below are cached; the home directory doesn't
+    change while the app runs.
+    """
     documents_dir = Path.home() / "Documents"
     return documents_dir / APP_NAME
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Get the path to the config file."""
     return get_app_dir() / "config.yaml"
 
 
+@functools.lru_cache(maxsize=1)
 def get_data_dir() -> Path:
     """Get the meetings directory path."""
     return get_app_dir() / "data"
 
 
+@functools.lru_cache(maxsize=1)
 def get_models_dir() -> Path:
     """Get the models directory path."""
     return get_app_dir() / "models"
 
 
+@functools.lru_cache(maxsize=1)
 def get_profiles_dir() -> Path:
     """Get the profiles directory path."""
     return get_app_dir() / "profiles"
 
 
+def get_whisper_model_filename(model_name: str, quant: str | None = None) -> str:
+    """Get the whisperfile name for a model.
+
+    Args:
+        model_name (str): Whisper model name (e.g. base.en)
+        quant (str | None): Quantization suffix of the weights (e.g. q5_0),
+            or None for the full-precision whisperfile
+
+    Returns:
+        str: File name of the whisperfile
+    """
+    suffix = f"-{quant}" if quant else ""
+    return f"whisper-{model_name}{suffix}.llamafile"
+
+
+@functools.lru_cache(maxsize=1)
+def get_cache_dir() -> Path:
+    """Get the directory for on-disk caches."""
+    return get_app_dir() / ".cache"
+
+
 def create_session_dir() -> Path:
     """Create a new directory for a meeting session.
 
@@ -48,35 +86,49 @@ def create_session_dir() -> Path:
     return session_dir
 
 
+@functools.lru_cache(maxsize=1)
 def is_first_run() -> bool:
-    """Check if this is the first time the app is being run."""
-    return not get_config_path().exists()
+    """Check if this is the first time the app is being run.
+
+    Cached until save_config writes the config file.
+    """
+    return not os.path.exists(get_config_path())
 
 
 def create_app_directory_structure() -> None:
     """Create the application directory structure."""
-    # Create main app directory in Documents
-    app_dir = get_app_dir()
-    app_dir.mkdir(exist_ok=True, parents=True)
+    # The app directory in Documents and its main subdirectories
+    dirs = (get_data_dir(), get_models_dir(), get_profiles_dir())
+    if all(os.path.isdir(d) for d in dirs):
+        return
 
-    # Create main subdirectories
-    get_data_dir().mkdir(exist_ok=True)
-    get_models_dir().mkdir(exist_ok=True)
-    get_profiles_dir().mkdir(exist_ok=True)
+    for d in dirs:
+        os.makedirs(d, exist_ok=True)
 
 
 def save_config(config: Dict[str, Any]) -> None:
-    """Save configuration to the config file."""
-    with open(get_config_path(), "w") as f:
-        yaml.dump(config, f, default_flow_style=False)
+    """Save configuration to the config file.
+
+    The file is written to a temporary sibling and swapped in, so a crash
+    mid-write never leaves a truncated config behind.
+    """
+    config_path = get_config_path()
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8", buffering=65536) as f:
+        # Keep the config's own key order; it also skips the sort pass
+        yaml.dump(
+            config, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+        )
+    os.replace(tmp_path, config_path)
+    is_first_run.cache_clear()
 
 
 def load_config() -> Dict[str, Any]:
     """Load configuration from the config file."""
     config_path = get_config_path()
     if config_path.exists():
-        with open(config_path, "r") as f:
-            return yaml.safe_load(f) or {}
+        with open(config_path, "rb") as f:
+            return yaml.load(f.read(), Loader=_YamlLoader) or {}
     return {}
 
 
@@ -84,25 +136,32 @@ def reveal_in_file_manager(path: Union[str, Path]):
     """Reveal the file in the system's file manager (Finder/Explorer/etc)."""
     path = str(path)
 
-    if platform.system() == "Darwin":  # macOS
-        # Use AppleScript to reveal in Finder
+    system = platform.system()
+    if system == "Darwin":  # macOS
+        # Reveal and bring Finder to the front with a single AppleScript run
+        script_path = path.replace("\\", "\\\\").replace('"', '\\"')
         subprocess.run(
             [
                 "osascript",
                 "-e",
-                f'tell application "Finder" to reveal POSIX file "{path}"',
+                'tell application "Finder"',
+                "-e",
+                f'reveal POSIX file "{script_path}"',
+                "-e",
+                "activate",
+                "-e",
+                "end tell",
             ]
         )
-        subprocess.run(["osascript", "-e", 'tell application "Finder" to activate'])
-    elif platform.system() == "Windows":
+    elif system == "Windows":
         # Windows Explorer's select functionality
         subprocess.run(["explorer", "/select,", path])
     else:  # Linux
         # Most file managers support showing containing folder
         folder_path = os.path.dirname(path)
-        try:
+        if shutil.which("xdg-open"):
             subprocess.run(["xdg-open", folder_path])
-        except FileNotFoundError:
+        else:
             # Fallback for systems without xdg-open
             subprocess.run(["gio", "open", folder_path])
 